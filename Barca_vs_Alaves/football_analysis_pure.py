@@ -4,15 +4,26 @@ Football Event Data Analysis
 Analyzes 15946.json containing football match events
 """
 
-import json
+import os
+import sys
 from collections import Counter, defaultdict
 
+# Shared loader: fast JSON decoding plus schema normalization, so every event
+# has 'type', 'team', 'possession_team' and 'player' as {'id', 'name'} objects
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'match_analysis_3'))
+from normalize import load_events
+
+# Fields validated by normalize plus the ones read here
+EVENT_FIELDS = ('index', 'period', 'timestamp', 'minute', 'second', 'possession',
+                'type', 'possession_team', 'team', 'player')
+
 # Load data
 print("🔄 Loading football events data...")
-with open('/home/sohamkc/something/15946.json', 'r') as f:
-    events_data = json.load(f)
+events_data, quarantine = load_events('/home/sohamkc/something/15946.json', fields=EVENT_FIELDS)
 
 print(f"✓ Loaded {len(events_data)} events\n")
+if quarantine:
+    print(f"⚠ {len(quarantine)} malformed events quarantined\n")
 
 # ============================================================================
 # DATASET OVERVIEW
@@ -21,7 +32,7 @@ print("="*70)
 print("DATASET OVERVIEW")
 print("="*70)
 print(f"\nTotal Events: {len(events_data)}")
-print(f"First Event Keys: {list(events_data[0].keys())}")
+print(f"First Event Keys (after field projection and normalization): {list(events_data[0].keys())}")
 
 # Extract basic information
 teams = set()
@@ -31,20 +42,12 @@ max_period = 0
 max_minute = 0
 
 for event in events_data:
-    if 'type' in event and isinstance(event['type'], dict):
-        event_types[event['type'].get('name')] += 1
-    
-    if 'team' in event and isinstance(event['team'], dict):
-        teams.add(event['team'].get('name'))
-    
-    if 'player' in event and isinstance(event['player'], dict):
-        players.add(event['player'].get('name'))
-    
-    if 'period' in event:
-        max_period = max(max_period, event['period'])
-    
-    if 'minute' in event:
-        max_minute = max(max_minute, event['minute'])
+    event_types[event['type']['name']] += 1
+    teams.add(event['team']['name'])
+    if event['player']['name']:
+        players.add(event['player']['name'])
+    max_period = max(max_period, event['period'])
+    max_minute = max(max_minute, event['minute'])
 
 # ============================================================================
 # EVENT TYPES ANALYSIS
@@ -71,19 +74,10 @@ team_possession = defaultdict(int)
 team_data = defaultdict(lambda: defaultdict(int))
 
 for event in events_data:
-    if 'team' in event and isinstance(event['team'], dict):
-        team_name = event['team'].get('name')
-        team_events[team_name] += 1
-    
-    if 'possession_team' in event and isinstance(event['possession_team'], dict):
-        team_name = event['possession_team'].get('name')
-        team_possession[team_name] += 1
-    
-    # Extract event type and team for metrics
-    if isinstance(event.get('type'), dict) and isinstance(event.get('team'), dict):
-        event_name = event['type'].get('name')
-        team_name = event['team'].get('name')
-        team_data[team_name][event_name] += 1
+    team_name = event['team']['name']
+    team_events[team_name] += 1
+    team_possession[event['possession_team']['name']] += 1
+    team_data[team_name][event['type']['name']] += 1
 
 print(f"\nTeams: {', '.join(sorted(teams))}")
 print(f"Match Duration: {max_minute} minutes across {int(max_period)} periods")
@@ -129,12 +123,10 @@ print("="*70)
 player_events = defaultdict(lambda: {'count': 0, 'team': None})
 
 for event in events_data:
-    if isinstance(event.get('player'), dict):
-        player_name = event['player'].get('name')
-        if player_name:
-            player_events[player_name]['count'] += 1
-            if event.get('team') and isinstance(event['team'], dict):
-                player_events[player_name]['team'] = event['team'].get('name')
+    player_name = event['player']['name']
+    if player_name:
+        player_events[player_name]['count'] += 1
+        player_events[player_name]['team'] = event['team']['name']
 
 # Sort by event count
 sorted_players = sorted(player_events.items(), key=lambda x: x[1]['count'], reverse=True)
@@ -155,10 +147,8 @@ print("="*70)
 timeline = defaultdict(lambda: defaultdict(int))
 
 for event in events_data:
-    if 'minute' in event and 'team' in event and isinstance(event['team'], dict):
-        interval = (event['minute'] // 5) * 5
-        team = event['team'].get('name')
-        timeline[interval][team] += 1
+    interval = (event['minute'] // 5) * 5
+    timeline[interval][event['team']['name']] += 1
 
 print("\n Time  | ", end="")
 for team in sorted(teams):
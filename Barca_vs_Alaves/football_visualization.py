@@ -4,16 +4,25 @@ Football Event Data Visualization
 Creates charts from the football match data
 """
 
-import json
+import os
+import sys
 from collections import Counter, defaultdict
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 
+# Shared loader: fast JSON decoding plus schema normalization, so every event
+# has 'type', 'team' and 'player' as {'id', 'name'} objects
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'match_analysis_3'))
+from normalize import load_events
+
+# Fields validated by normalize plus the ones read here
+EVENT_FIELDS = ('index', 'period', 'timestamp', 'minute', 'second', 'possession',
+                'type', 'team', 'player')
+
 # Load data
 print("🔄 Loading and analyzing football data...")
-with open('/home/sohamkc/something/15946.json', 'r') as f:
-    events_data = json.load(f)
+events_data, _ = load_events('/home/sohamkc/something/15946.json', fields=EVENT_FIELDS)
 
 # Extract information
 event_types = Counter()
@@ -24,39 +33,33 @@ team_names = set()
 
 for event in events_data:
     # Event types
-    if 'type' in event and isinstance(event['type'], dict):
-        event_type = event['type'].get('name')
-        event_types[event_type] += 1
+    event_type = event['type']['name']
+    event_types[event_type] += 1
     
     # Team data
-    if 'team' in event and isinstance(event['team'], dict):
-        team = event['team'].get('name')
-        team_names.add(team)
-        teams_data[team]['events'] += 1
-        
-        # Track specific events
-        if event_type == 'Pass':
-            teams_data[team]['passes'] += 1
-        elif event_type == 'Shot':
-            teams_data[team]['shots'] += 1
-        elif event_type == 'Foul Committed':
-            teams_data[team]['fouls'] += 1
-        elif event_type == 'Interception':
-            teams_data[team]['interceptions'] += 1
+    team = event['team']['name']
+    team_names.add(team)
+    teams_data[team]['events'] += 1
+    
+    # Track specific events
+    if event_type == 'Pass':
+        teams_data[team]['passes'] += 1
+    elif event_type == 'Shot':
+        teams_data[team]['shots'] += 1
+    elif event_type == 'Foul Committed':
+        teams_data[team]['fouls'] += 1
+    elif event_type == 'Interception':
+        teams_data[team]['interceptions'] += 1
     
     # Timeline
-    if 'minute' in event and 'team' in event and isinstance(event['team'], dict):
-        interval = (event['minute'] // 5) * 5
-        team = event['team'].get('name')
-        timeline[interval][team] += 1
+    interval = (event['minute'] // 5) * 5
+    timeline[interval][team] += 1
     
     # Players
-    if isinstance(event.get('player'), dict):
-        player_name = event['player'].get('name')
-        if player_name:
-            player_events[player_name]['count'] += 1
-            if event.get('team') and isinstance(event['team'], dict):
-                player_events[player_name]['team'] = event['team'].get('name')
+    player_name = event['player']['name']
+    if player_name:
+        player_events[player_name]['count'] += 1
+        player_events[player_name]['team'] = team
 
 teams = sorted(team_names)
 
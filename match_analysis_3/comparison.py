@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Cross-Match Comparison Matrices
+===============================================================
+
+Aggregates every (match, team) pair of an event store (see event_store.py)
+into one metric row, saves the rows next to the store and builds NumPy
+comparison matrices from them: team x metric (averaged over matches) and
+team x match for a single metric. Ranks, percentiles and z-scores are
+computed for all teams and metrics at once, so league-wide comparisons
+never reopen the raw JSON files.
+
+Usage:
+    python comparison.py
+    python comparison.py event_store 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+
+import numpy as np
+
+from event_store import build_store, open_store, META_FILE, STORE_DIR
+from pass_engine import pass_geometry, PITCH_LENGTH, PITCH_WIDTH
+
+# Configuration
+DATA_FILES = ['19736.json']
+AGGREGATES_FILE = 'aggregates.npz'
+AGGREGATES_VERSION = 2            # bump when a metric definition changes
+DEFENSIVE_TYPES = ('Interception', 'Clearance', 'Duel')
+BOX_DEPTH = 18.0
+BOX_WIDTH = 44.0
+
+# Per-match metrics, one column each; the last three are rates, not counts
+METRICS = ('events', 'passes', 'shots', 'pressures', 'defensive_actions',
+           'progressive_passes', 'final_third_entries', 'box_touches',
+           'possession_pct', 'under_pressure_pct', 'mean_pass_length')
+
+
+def aggregate_store(store):
+    """
+    One metric row per (match, team) from the store's memory-mapped columns.
+
+    Returns (match_ids, teams, values) with values shaped (rows, len(METRICS)).
+    """
+    if 'completed' not in store.columns:
+        raise ValueError("event store has no 'completed' column: rebuild it with event_store.py")
+    match_ids = np.array(sorted(store.matches), dtype=np.int64)
+    team_names = store.names('team')
+    n_teams = len(team_names)
+    size = len(match_ids) * n_teams
+    match_index = np.searchsorted(match_ids, store['match_id'])
+
+    def groups(field):
+        codes = np.asarray(store[field], dtype=np.int64)
+        return np.where(codes >= 0, match_index * n_teams + codes, -1)
+
+    team = groups('team')
+
+    def count(mask, group=team, weights=None):
+        mask = mask & (group >= 0)
+        return np.bincount(group[mask], weights=None if weights is None else weights[mask],
+                           minlength=size)
+
+    event_type = np.asarray(store['type'])
+    is_type = {name: event_type == store.code('type', name)
+               for name in ('Pass', 'Shot', 'Pressure') + DEFENSIVE_TYPES}
+    x = np.asarray(store['x'], dtype=np.float64)
+    y = np.asarray(store['y'], dtype=np.float64)
+    everything = np.ones(len(store), dtype=bool)
+
+    passes = is_type['Pass']
+    geometry = pass_geometry({
+        'x': x[passes], 'y': y[passes],
+        'end_x': np.asarray(store['end_x'], dtype=np.float64)[passes],
+        'end_y': np.asarray(store['end_y'], dtype=np.float64)[passes],
+        'outcome': np.where(np.asarray(store['completed'])[passes], 'Complete', 'Incomplete'),
+    })
+    completed = geometry['completed']
+    pass_group = team[passes]
+    has_length = ~np.isnan(geometry['length'])
+    pass_length = count(has_length, pass_group, np.nan_to_num(geometry['length']))
+    measured = count(has_length, pass_group)
+
+    events = count(everything)
+    match_events = np.bincount(match_index, minlength=len(match_ids)).repeat(n_teams)
+    in_box = ((x >= PITCH_LENGTH - BOX_DEPTH)
+              & (np.abs(y - PITCH_WIDTH / 2) <= BOX_WIDTH / 2))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        columns = {
+            'events': events,
+            'passes': count(passes),
+            'shots': count(is_type['Shot']),
+            'pressures': count(is_type['Pressure']),
+            'defensive_actions': count(np.any([is_type[t] for t in DEFENSIVE_TYPES], axis=0)),
+            'progressive_passes': count(completed & geometry['progressive'], pass_group),
+            'final_third_entries': count(completed & geometry['final_third_entry'], pass_group),
+            'box_touches': count(in_box),
+            'possession_pct': 100 * count(everything, groups('possession_team')) / match_events,
+            'under_pressure_pct': 100 * count(np.asarray(store['under_pressure'])) / events,
+            'mean_pass_length': np.where(measured > 0, pass_length / measured, np.nan),
+        }
+    played = events > 0
+    values = np.column_stack([columns[name] for name in METRICS]).astype(np.float64)[played]
+    rows = np.nonzero(played)[0]
+    teams = np.array(team_names, dtype=str)[rows % n_teams] if n_teams else np.zeros(0, dtype=str)
+    return match_ids[rows // n_teams], teams, values
+
+
+def save_aggregates(path, match_ids, teams, values):
+    """Write aggregate rows to a .npz file (plain arrays, no pickling)."""
+    np.savez(path, match_ids=match_ids, teams=np.asarray(teams, dtype=str),
+             values=values, metrics=np.array(METRICS), version=AGGREGATES_VERSION)
+
+
+def load_aggregates(path):
+    """Read (match_ids, teams, values) saved by save_aggregates."""
+    with np.load(path, allow_pickle=False) as data:
+        if tuple(data['metrics']) != METRICS or 'version' not in data \
+                or int(data['version']) != AGGREGATES_VERSION:
+            raise ValueError(f"'{path}' was written with different metric definitions")
+        return data['match_ids'], data['teams'], data['values']
+
+
+def store_aggregates(store_dir=STORE_DIR):
+    """Aggregates of a store, recomputed only when the store is newer than the cache."""
+    path = os.path.join(store_dir, AGGREGATES_FILE)
+    meta = os.path.join(store_dir, META_FILE)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(meta):
+        try:
+            return load_aggregates(path)
+        except ValueError:
+            pass
+    match_ids, teams, values = aggregate_store(open_store(store_dir))
+    save_aggregates(path, match_ids, teams, values)
+    return match_ids, teams, values
+
+
+def team_metric_matrix(teams, values, how='mean'):
+    """(team_names, matrix) with one row per team: mean (or sum) over its matches."""
+    names, codes = np.unique(teams, return_inverse=True)
+    totals = np.zeros((len(names), values.shape[1]))
+    np.add.at(totals, codes, np.nan_to_num(values))
+    if how == 'sum':
+        return names, totals
+    if how != 'mean':
+        raise ValueError(f"how must be 'mean' or 'sum', not '{how}'")
+    counts = np.zeros_like(totals)
+    np.add.at(counts, codes, ~np.isnan(values))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return names, np.where(counts > 0, totals / counts, np.nan)
+
+
+def team_match_matrix(match_ids, teams, values, metric):
+    """(team_names, match_ids, matrix) for one metric; NaN where a team did not play."""
+    names, team_codes = np.unique(teams, return_inverse=True)
+    matches, match_codes = np.unique(match_ids, return_inverse=True)
+    matrix = np.full((len(names), len(matches)), np.nan)
+    matrix[team_codes, match_codes] = values[:, METRICS.index(metric)]
+    return names, matches, matrix
+
+
+def rank(matrix, axis=0, descending=True):
+    """1-based ranks along an axis (1 = highest by default); NaN stays NaN, ties keep order."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    missing = np.isnan(matrix)
+    keys = np.where(missing, np.inf, -matrix if descending else matrix)
+    order = np.argsort(keys, axis=axis, kind='stable')
+    shape = [1] * matrix.ndim
+    shape[axis] = matrix.shape[axis]
+    positions = np.arange(1, matrix.shape[axis] + 1, dtype=np.float64).reshape(shape)
+    ranks = np.empty(matrix.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, np.broadcast_to(positions, matrix.shape), axis)
+    ranks[missing] = np.nan
+    return ranks
+
+
+def percentile(matrix, axis=0):
+    """Percentile (0-100) of each value among the non-NaN values along an axis; ties share."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    moved = np.moveaxis(matrix, axis, 0)
+    columns = moved.reshape(moved.shape[0], int(np.prod(moved.shape[1:])))
+    ordered = np.sort(columns, axis=0)                  # NaN sorts last
+    valid = (~np.isnan(columns)).sum(axis=0)
+    result = np.full(columns.shape, np.nan)
+    for column in np.nonzero(valid)[0]:
+        sorted_values = ordered[:valid[column], column]
+        values = columns[:, column]
+        below = np.searchsorted(sorted_values, values, side='left')
+        equal = np.searchsorted(sorted_values, values, side='right') - below
+        result[:, column] = 100 * (below + 0.5 * equal) / valid[column]
+    result[np.isnan(columns)] = np.nan
+    return np.moveaxis(result.reshape(moved.shape), 0, axis)
+
+
+def zscore(matrix, axis=0):
+    """Standard scores along an axis, ignoring NaN; constant columns score 0."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    mean = np.nanmean(matrix, axis=axis, keepdims=True)
+    std = np.nanstd(matrix, axis=axis, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(std > 0, (matrix - mean) / std, 0.0)
+    return np.where(np.isnan(matrix), np.nan, scores)
+
+
+def main():
+    """Main execution function."""
+    store_dir = sys.argv[1] if len(sys.argv) > 1 else STORE_DIR
+    paths = sys.argv[2:]
+    if paths or not os.path.exists(os.path.join(store_dir, META_FILE)):
+        paths = paths or DATA_FILES
+        missing = [p for p in paths if not os.path.exists(p)]
+        if missing:
+            print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+            return 1
+        build_store(paths, store_dir)
+        print(f"✓ Event store written to '{store_dir}/'")
+
+    match_ids, teams, values = store_aggregates(store_dir)
+    names, table = team_metric_matrix(teams, values)
+    print(f"✓ {len(values)} team-match rows, {len(names)} teams, {len(np.unique(match_ids))} match(es)\n")
+
+    ranks = rank(table)
+    scores = zscore(table)
+    print("="*80)
+    print("TEAM COMPARISON (per-match averages, rank and z-score)")
+    print("="*80)
+    for metric in ('passes', 'shots', 'progressive_passes', 'box_touches', 'possession_pct'):
+        column = METRICS.index(metric)
+        print(f"\n{metric}:")
+        for row in np.argsort(ranks[:, column]):
+            print(f"  {ranks[row, column]:3.0f}. {names[row]:25s} {table[row, column]:8.1f}  "
+                  f"(z {scores[row, column]:+.2f})")
+
+    team_names, matches, matrix = team_match_matrix(match_ids, teams, values, 'passes')
+    print("\nPasses by team and match (percentile within each match column):")
+    percentiles = percentile(matrix)
+    for row, team in enumerate(team_names):
+        cells = '  '.join('    -   ' if np.isnan(v) else f"{v:4.0f} ({p:3.0f})"
+                          for v, p in zip(matrix[row], percentiles[row]))
+        print(f"  {team:25s} {cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Memory-Mapped Event Store
+=========================================================
+
+Converts match JSON files into flat numeric columns (one raw binary file per
+column) plus a small JSON string dictionary. Any number of worker processes
+can then open the store with np.memmap and share the OS page cache instead of
+each loading and holding its own copy of the events.
+
+Team, player, event type and play pattern names are interned to integer
+codes; missing values are stored as -1 (codes) or NaN (coordinates).
+
+Usage:
+    python event_store.py
+    python event_store.py event_store 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import json
+import sys
+import os
+
+import numpy as np
+
+from normalize import load_events
+
+# Configuration
+DATA_FILES = ['19736.json']
+STORE_DIR = 'event_store'
+META_FILE = 'meta.json'
+
+# Column name -> dtype of the flattened event table
+COLUMNS = {
+    'match_id': np.int32,
+    'index': np.int32,
+    'period': np.int8,
+    'minute': np.int16,
+    'second': np.int8,
+    'clock': np.float32,          # seconds since the start of the period
+    'possession': np.int32,
+    'type': np.int16,
+    'team': np.int16,
+    'possession_team': np.int16,
+    'play_pattern': np.int16,
+    'player': np.int32,
+    'x': np.float32,
+    'y': np.float32,
+    'end_x': np.float32,
+    'end_y': np.float32,
+    'duration': np.float32,
+    'under_pressure': np.bool_,
+    'completed': np.bool_,        # passes without an outcome; False for other events
+}
+STRING_TABLES = ('type', 'team', 'possession_team', 'play_pattern', 'player')
+SHARED_TABLES = {'possession_team': 'team'}
+END_LOCATION_FIELDS = ('pass', 'carry', 'shot')
+
+
+def parse_clock(timestamp):
+    """Convert an 'HH:MM:SS.mmm' timestamp to seconds."""
+    hours, minutes, seconds = timestamp.split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+class StringTable:
+    """Interns names to dense integer codes."""
+
+    def __init__(self, names=None):
+        self.names = list(names or [])
+        self.codes = {name: code for code, name in enumerate(self.names)}
+
+    def code(self, name):
+        if name is None:
+            return -1
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+def flatten_match(events, match_id, tables):
+    """Flatten one normalized match into a dict of NumPy columns."""
+    n = len(events)
+    columns = {name: np.empty(n, dtype=dtype) for name, dtype in COLUMNS.items()}
+    nan = float('nan')
+
+    for i, event in enumerate(events):
+        columns['index'][i] = event['index']
+        columns['period'][i] = event['period']
+        columns['minute'][i] = event['minute']
+        columns['second'][i] = event['second']
+        columns['clock'][i] = parse_clock(event['timestamp'])
+        columns['possession'][i] = event['possession']
+        for field in STRING_TABLES:
+            columns[field][i] = tables[SHARED_TABLES.get(field, field)].code(event[field]['name'])
+        location = event['location'] or (nan, nan)
+        columns['x'][i], columns['y'][i] = location[0], location[1]
+        end = (nan, nan)
+        for field in END_LOCATION_FIELDS:
+            if 'end_location' in event.get(field, ()):
+                end = event[field]['end_location']
+                break
+        columns['end_x'][i], columns['end_y'][i] = end[0], end[1]
+        columns['duration'][i] = event['duration']
+        columns['under_pressure'][i] = event['under_pressure']
+        columns['completed'][i] = event['type']['name'] == 'Pass' and 'outcome' not in event['pass']
+
+    columns['match_id'][:] = match_id
+    return columns
+
+
+def match_id_from_path(path):
+    """StatsBomb files are named after their match id."""
+    return int(os.path.splitext(os.path.basename(path))[0])
+
+
+def build_store(paths, store_dir=STORE_DIR):
+    """Convert match files into a memory-mapped store, one match at a time."""
+    os.makedirs(store_dir, exist_ok=True)
+    tables = {name: StringTable() for name in STRING_TABLES if name not in SHARED_TABLES}
+    handles = {name: open(os.path.join(store_dir, f"{name}.bin"), 'wb') for name in COLUMNS}
+    matches = []
+    offset = 0
+    quarantined = 0
+
+    try:
+        for path in paths:
+            events, quarantine = load_events(path)
+            quarantined += len(quarantine)
+            match_id = match_id_from_path(path)
+            columns = flatten_match(events, match_id, tables)
+            for name, column in columns.items():
+                handles[name].write(column.tobytes())
+            matches.append({'match_id': match_id, 'start': offset, 'stop': offset + len(events)})
+            offset += len(events)
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    meta = {
+        'length': offset,
+        'columns': {name: np.dtype(dtype).str for name, dtype in COLUMNS.items()},
+        'strings': {name: table.names for name, table in tables.items()},
+        'matches': matches,
+        'quarantined': quarantined,
+    }
+    with open(os.path.join(store_dir, META_FILE), 'w') as f:
+        json.dump(meta, f)
+    return meta
+
+
+class EventStore:
+    """Read-only, zero-copy view of a store written by build_store."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        with open(os.path.join(store_dir, META_FILE), 'r') as f:
+            meta = json.load(f)
+        self.store_dir = store_dir
+        self.length = meta['length']
+        self.strings = meta['strings']
+        self.matches = {m['match_id']: (m['start'], m['stop']) for m in meta['matches']}
+        self.columns = {}
+        for name, dtype in meta['columns'].items():
+            path = os.path.join(store_dir, f"{name}.bin")
+            if self.length:
+                self.columns[name] = np.memmap(path, dtype=np.dtype(dtype), mode='r',
+                                               shape=(self.length,))
+            else:
+                self.columns[name] = np.empty(0, dtype=np.dtype(dtype))
+        self._codes = {}
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def match(self, match_id):
+        """Column views (no copies) for a single match."""
+        start, stop = self.matches[match_id]
+        return {name: column[start:stop] for name, column in self.columns.items()}
+
+    def names(self, field):
+        """String table used by a coded column."""
+        return self.strings[SHARED_TABLES.get(field, field)]
+
+    def code(self, field, name):
+        """Integer code of a name in a coded column, or -1 if unknown."""
+        table = SHARED_TABLES.get(field, field)
+        if table not in self._codes:
+            self._codes[table] = {n: c for c, n in enumerate(self.strings[table])}
+        return self._codes[table].get(name, -1)
+
+    def decode(self, field, codes):
+        """Map an array of codes back to names (None for -1)."""
+        names = np.array(self.names(field) + [None], dtype=object)
+        return names[np.asarray(codes)]
+
+
+def open_store(store_dir=STORE_DIR):
+    """Open an existing store; safe to call from any number of processes."""
+    return EventStore(store_dir)
+
+
+def main():
+    """Main execution function."""
+    store_dir = sys.argv[1] if len(sys.argv) > 1 else STORE_DIR
+    paths = sys.argv[2:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    meta = build_store(paths, store_dir)
+    store = open_store(store_dir)
+    print(f"✓ Store written to '{store_dir}/': {len(store):,} events, "
+          f"{len(store.matches)} match(es), {meta['quarantined']} quarantined")
+    for field in ('type', 'team', 'player'):
+        print(f"  • {field:10s}: {len(store.names(field)):5d} distinct names")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Fast JSON Loading
+=================================================
+
+Pluggable JSON decoding for the match files. The fastest installed backend
+is used (orjson, ujson, then the standard library json module), and a field
+projection keeps only the keys an analysis reads, so large, unused parts of
+each event (tactics, freeze frames, related events) do not stay in memory as
+Python objects. These backends build the whole document first and apply the
+projection right after decoding.
+
+simdjson can be selected explicitly: both the kept fields and the drop paths
+are applied while walking its lazy document, so dropped keys are never
+converted to Python objects. That walk runs in Python, and on match files it
+is slower than orjson or the standard library, so it is not chosen by default.
+
+The backend can be forced with the MATCH_JSON_BACKEND environment variable.
+
+Usage:
+    python fast_json.py
+    python fast_json.py ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import importlib
+import sys
+import os
+import time
+
+# Configuration
+DATA_FILE = '19736.json'
+BACKEND_ENV = 'MATCH_JSON_BACKEND'
+PREFERENCE = ('orjson', 'ujson', 'json')      # fastest first; simdjson only on request
+REPEATS = 5
+
+# Parts of an event most analyses never read (dotted paths reach into details)
+HEAVY_FIELDS = ('tactics', 'related_events', 'shot.freeze_frame')
+
+
+def _plain(value):
+    """Convert a lazy simdjson value into plain Python objects."""
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if hasattr(value, 'as_list'):
+        return value.as_list()
+    return value
+
+
+def drop_tree(drop):
+    """Nested dict of dotted drop paths; a None leaf marks a key to drop."""
+    tree = {}
+    for path in drop:
+        node = tree
+        *parents, last = path.split('.')
+        for key in parents:
+            node = node.setdefault(key, {})
+            if node is None:
+                break
+        else:
+            node[last] = None
+    return tree
+
+
+def _materialise(value, tree):
+    """Convert a lazy simdjson value, skipping the keys marked in tree."""
+    if not tree or not hasattr(value, 'as_dict'):
+        return _plain(value)
+    return {key: _materialise(value[key], tree.get(key, {}))
+            for key in value.keys() if tree.get(key, {}) is not None}
+
+
+def _simdjson_decoder(module):
+    def decode(data, fields=None, drop=()):
+        document = module.Parser().parse(data)
+        if not hasattr(document, 'as_list') or (fields is None and not drop):
+            return _plain(document)
+        tree = drop_tree(drop)
+        if fields is None:
+            return [_materialise(record, tree) for record in document]
+        return [{key: _materialise(record[key], tree.get(key, {})) for key in fields
+                 if key in record and tree.get(key, {}) is not None}
+                for record in document]
+    return decode
+
+
+def _loads_decoder(loads):
+    def decode(data, fields=None, drop=()):
+        records = loads(data)
+        if not isinstance(records, list):
+            return records
+        if fields is not None:
+            records = [{key: record[key] for key in fields if key in record} for record in records]
+        return drop_paths(records, drop)
+    return decode
+
+
+DECODERS = {
+    'orjson': lambda module: _loads_decoder(module.loads),
+    'ujson': lambda module: _loads_decoder(module.loads),
+    'json': lambda module: _loads_decoder(module.loads),
+    'simdjson': _simdjson_decoder,
+}
+
+
+def available_backends():
+    """Names of the installed backends, default preference order first."""
+    names = []
+    for name in DECODERS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(backend=None):
+    """
+    (name, decode) for the requested backend, the MATCH_JSON_BACKEND one or
+    the fastest installed one. decode(data, fields, drop) takes bytes.
+    """
+    requested = backend or os.environ.get(BACKEND_ENV)
+    for name in ([requested] if requested else []) + list(PREFERENCE):
+        if name not in DECODERS:
+            raise ValueError(f"unknown JSON backend '{name}' (choose from {', '.join(DECODERS)})")
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        return name, DECODERS[name](module)
+    raise ImportError("no JSON backend available")
+
+
+def drop_paths(records, drop):
+    """Remove dotted paths such as 'shot.freeze_frame' from every record, in place."""
+    paths = [path.split('.') for path in drop]
+    for record in records:
+        for path in paths:
+            parent = record
+            for key in path[:-1]:
+                parent = parent.get(key)
+                if not isinstance(parent, dict):
+                    break
+            else:
+                parent.pop(path[-1], None)
+    return records
+
+
+def loads(data, fields=None, drop=(), backend=None):
+    """
+    Decode a JSON array of events.
+
+    fields keeps only these top-level keys; drop removes dotted paths.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    _, decode = get_decoder(backend)
+    return decode(data, tuple(fields) if fields is not None else None, tuple(drop))
+
+
+def load(path, fields=None, drop=(), backend=None):
+    """Load a match file (see loads)."""
+    with open(path, 'rb') as f:
+        return loads(f.read(), fields, drop, backend)
+
+
+def main():
+    """Main execution function."""
+    path = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    if not os.path.exists(path):
+        print(f"❌ Error: Dataset file '{path}' not found!")
+        return 1
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    print(f"✓ Installed backends: {', '.join(available_backends())}")
+    for name in available_backends():
+        for label, kwargs in (('full', {}), ('without heavy fields', {'drop': HEAVY_FIELDS})):
+            start = time.perf_counter()
+            for _ in range(REPEATS):
+                events = loads(data, backend=name, **kwargs)
+            elapsed = (time.perf_counter() - start) / REPEATS
+            print(f"  • {name:9s} {label:21s} {elapsed * 1000:7.1f} ms  ({len(events):,} events)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,6 @@ Date: February 2026
 """
 
 import pandas as pd
-import numpy as np
 import json
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -23,12 +22,17 @@ import warnings
 import sys
 import os
 
+from normalize import load_events
+from pass_engine import pass_arrays, pass_geometry
+from playing_time import per90_table, MIN_MINUTES
+
 warnings.filterwarnings('ignore')
 
 # Configuration
 DATA_FILE = '19736.json'
 OUTPUT_DIR = 'output'
 DPI = 300
+DROP_FIELDS = ('related_events', 'shot.freeze_frame')  # tactics kept: minutes need the lineups
 
 def setup_environment():
     """Setup visualization environment and create output directory."""
@@ -57,23 +61,24 @@ def load_data():
         print("Please ensure the data file is in the same directory.")
         sys.exit(1)
     
-    with open(DATA_FILE, 'r') as f:
-        data = json.load(f)
-    
+    data, quarantine = load_events(DATA_FILE, drop=DROP_FIELDS)
     print(f"✓ Dataset loaded: {len(data):,} events")
+    if quarantine:
+        print(f"⚠ {len(quarantine):,} malformed events quarantined")
     
     # Convert to DataFrame
     df = pd.DataFrame(data)
     
-    # Extract nested fields
-    df['event_type'] = df['type'].apply(lambda x: x.get('name', 'Unknown') if isinstance(x, dict) else 'Unknown')
-    df['team_name'] = df['team'].apply(lambda x: x.get('name', 'Unknown') if isinstance(x, dict) else 'Unknown')
-    df['possession_team_name'] = df['possession_team'].apply(lambda x: x.get('name', 'Unknown') if isinstance(x, dict) else 'Unknown')
-    df['play_pattern_name'] = df['play_pattern'].apply(lambda x: x.get('name', 'Unknown') if isinstance(x, dict) else 'Unknown')
+    # Extract nested fields (shape guaranteed by normalize_events)
+    df['event_type'] = [e['type']['name'] for e in data]
+    df['team_name'] = [e['team']['name'] for e in data]
+    df['possession_team_name'] = [e['possession_team']['name'] for e in data]
+    df['play_pattern_name'] = [e['play_pattern']['name'] for e in data]
+    df['player_name'] = [e['player']['name'] for e in data]
     
     print(f"✓ Data processed: {len(df.columns)} features extracted")
     
-    return df
+    return df, data
 
 def analyze_events(df):
     """Analyze event distribution."""
@@ -166,15 +171,12 @@ def analyze_passes(df):
     """Analyze pass patterns."""
     print("\n[6/10] Analyzing pass patterns...")
     
-    passes = df[df['event_type'] == 'Pass'].copy()
+    passes = df[(df['event_type'] == 'Pass') & df['location'].notna()].copy()
     
     if len(passes) > 0 and 'pass' in passes.columns:
-        passes['pass_length'] = passes['pass'].apply(
-            lambda x: x.get('length', np.nan) if isinstance(x, dict) else np.nan
-        )
-        passes['pass_outcome'] = passes['pass'].apply(
-            lambda x: x.get('outcome', {}).get('name', 'Complete') if isinstance(x, dict) else 'Complete'
-        )
+        pass_data = pass_arrays(passes['location'], passes['pass'])
+        passes['pass_length'] = pass_geometry(pass_data)['length']
+        passes['pass_outcome'] = pass_data['outcome']
         
         fig, axes = plt.subplots(1, 2, figsize=(16, 6))
         
@@ -256,21 +258,13 @@ def analyze_play_patterns(df):
     
     print("✓ Play pattern analysis complete")
 
-def analyze_players(df):
-    """Analyze player contributions."""
+def analyze_players(df, events):
+    """Analyze player contributions (raw totals and per 90 minutes)."""
     print("\n[9/10] Analyzing player contributions...")
     
-    player_events = []
-    for idx, row in df.iterrows():
-        if 'player' in row and isinstance(row['player'], dict):
-            player_events.append({
-                'player_name': row['player'].get('name', 'Unknown'),
-                'event_type': row['event_type'],
-                'team': row['team_name']
-            })
-    
-    if player_events:
-        player_df = pd.DataFrame(player_events)
+    player_df = df.loc[df['player_name'].notna(), ['player_name', 'event_type', 'team_name']]
+    
+    if len(player_df) > 0:
         top_players = player_df['player_name'].value_counts().head(15)
         
         fig, ax = plt.subplots(figsize=(12, 8))
@@ -289,6 +283,13 @@ def analyze_players(df):
         plt.savefig(f'{OUTPUT_DIR}/top_players.png', dpi=DPI, bbox_inches='tight')
         plt.close()
         
+        per90 = per90_table(events)
+        per90.to_csv(f'{OUTPUT_DIR}/player_minutes.csv')
+        ranked = per90[per90['minutes'] >= MIN_MINUTES].sort_values('per90', ascending=False)
+        print(f"  Top 5 by events per 90 (min. {MIN_MINUTES} minutes):")
+        for player, row in ranked.head(5).iterrows():
+            print(f"  • {player}: {row['per90']:.1f} per 90 ({row['minutes']:.0f} min)")
+        
         print(f"✓ Player analysis complete: {len(top_players)} top players identified")
     else:
         print("⚠ No player data available")
@@ -374,6 +375,7 @@ def print_summary(df, event_counts):
     print("Check the output folder for:")
     print("  - 8 high-resolution PNG visualizations")
     print("  - processed_match_data.csv")
+    print("  - player_minutes.csv")
     print("  - summary_statistics.json")
     print("\n" + "="*80)
 
@@ -381,14 +383,14 @@ def main():
     """Main execution function."""
     try:
         setup_environment()
-        df = load_data()
+        df, events = load_data()
         event_counts = analyze_events(df)
         analyze_teams(df)
         analyze_temporal(df)
         analyze_passes(df)
         analyze_possession(df)
         analyze_play_patterns(df)
-        analyze_players(df)
+        analyze_players(df, events)
         create_heatmap(df)
         export_data(df)
         print_summary(df, event_counts)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Schema Normalization
+====================================================
+
+Validates every event once against the parts of the StatsBomb event schema the
+analysis relies on, fills defaults for optional fields and moves malformed
+events into a quarantine report. Downstream stages can then read
+event['team']['name'], event['player']['name'] etc. directly, without
+repeating isinstance checks inside every loop or .apply call.
+
+Usage:
+    python normalize.py
+    python normalize.py ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import re
+import sys
+import os
+from collections import Counter
+
+from fast_json import load as load_json
+
+# Configuration
+DATA_FILE = '19736.json'
+UNKNOWN = 'Unknown'
+
+# Named references ({"id": ..., "name": ...}) and the value used when absent
+NAMED_DEFAULTS = {
+    'team': UNKNOWN,
+    'possession_team': UNKNOWN,
+    'play_pattern': UNKNOWN,
+    'player': None,
+    'position': None,
+}
+SCALAR_DEFAULTS = {
+    'duration': 0.0,
+    'under_pressure': False,
+    'counterpress': False,
+    'location': None,
+    'related_events': (),
+}
+INTEGER_FIELDS = ('index', 'period', 'minute', 'second', 'possession')
+TIMESTAMP = re.compile(r'\d{2}:\d{2}:\d{2}(\.\d+)?')   # 'HH:MM:SS.mmm' within the period
+
+# Event types whose detail object is read by the analysis
+DETAIL_FIELDS = {
+    'Pass': 'pass',
+    'Carry': 'carry',
+    'Shot': 'shot',
+    'Duel': 'duel',
+    'Interception': 'interception',
+    'Substitution': 'substitution',
+    'Starting XI': 'tactics',
+    'Tactical Shift': 'tactics',
+}
+
+
+def _named(value):
+    return isinstance(value, dict) and isinstance(value.get('name'), str)
+
+
+def _is_location(value):
+    return (isinstance(value, list) and len(value) >= 2
+            and all(isinstance(v, (int, float)) for v in value[:2]))
+
+
+def validate_event(event):
+    """Return the reason an event is malformed, or None if it is usable."""
+    if not isinstance(event, dict):
+        return 'not an object'
+    if not _named(event.get('type')):
+        return 'missing type'
+    for field in INTEGER_FIELDS:
+        value = event.get(field)
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            return f"invalid {field}"
+    timestamp = event.get('timestamp')
+    if not isinstance(timestamp, str) or not TIMESTAMP.fullmatch(timestamp):
+        return 'invalid timestamp'
+    for field in NAMED_DEFAULTS:
+        if field in event and not _named(event[field]):
+            return f"invalid {field}"
+    if 'location' in event and not _is_location(event['location']):
+        return 'invalid location'
+    detail = DETAIL_FIELDS.get(event['type']['name'])
+    if detail is not None and not isinstance(event.get(detail, {}), dict):
+        return f"invalid {detail}"
+    if detail == 'pass' and 'end_location' in event.get('pass', {}) \
+            and not _is_location(event['pass']['end_location']):
+        return 'invalid pass end_location'
+    return None
+
+
+def fill_defaults(event):
+    """Fill optional fields in place so every event has the same shape."""
+    for field, name in NAMED_DEFAULTS.items():
+        if field not in event:
+            event[field] = {'id': None, 'name': name}
+    for field, value in SCALAR_DEFAULTS.items():
+        event.setdefault(field, value)
+    detail = DETAIL_FIELDS.get(event['type']['name'])
+    if detail is not None:
+        event.setdefault(detail, {})
+    return event
+
+
+def normalize_events(events):
+    """
+    Validate and normalize a list of events.
+
+    Returns (clean_events, quarantine) where quarantine is a list of
+    {'position', 'id', 'reason'} records for the events that were dropped.
+    Clean events are normalized in place rather than copied.
+    """
+    clean = []
+    quarantine = []
+    for position, event in enumerate(events):
+        reason = validate_event(event)
+        if reason is None:
+            clean.append(fill_defaults(event))
+        else:
+            event_id = event.get('id') if isinstance(event, dict) else None
+            quarantine.append({'position': position, 'id': event_id, 'reason': reason})
+    return clean, quarantine
+
+
+def load_events(path, fields=None, drop=()):
+    """Load a match file (optionally projected, see fast_json.load) and normalize it."""
+    return normalize_events(load_json(path, fields, drop))
+
+
+def quarantine_summary(quarantine):
+    """Count quarantined events by reason."""
+    return Counter(record['reason'] for record in quarantine)
+
+
+def main():
+    """Main execution function."""
+    path = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    if not os.path.exists(path):
+        print(f"❌ Error: Dataset file '{path}' not found!")
+        return 1
+
+    events, quarantine = load_events(path)
+    print(f"✓ {len(events):,} events normalized, {len(quarantine):,} quarantined")
+    for reason, count in quarantine_summary(quarantine).most_common():
+        print(f"  • {reason:30s}: {count:5d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Vectorized Pass Geometry
+========================================================
+
+Extracts pass start/end coordinates into NumPy arrays once and derives every
+pass metric (length, angle, direction, progressive distance, thirds and zone
+transitions, completion) for all passes together, instead of per-row .apply
+calls. Works for one match or many matches concatenated.
+
+Pitch coordinates follow StatsBomb: 120 x 80, attacking towards x = 120,
+y increasing towards the attacker's right touchline.
+
+Usage:
+    python pass_engine.py
+    python pass_engine.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+from normalize import load_events
+from event_store import match_id_from_path
+
+# Configuration
+DATA_FILES = ['19736.json']
+PITCH_LENGTH = 120.0
+PITCH_WIDTH = 80.0
+GOAL = (120.0, 40.0)
+ZONE_COLUMNS = 6                  # zones along the pitch length
+ZONE_ROWS = 3                     # zones across the pitch width
+PROGRESSIVE_FRACTION = 0.25       # must end at least 25% closer to goal
+DIRECTIONS = np.array(['Forward', 'Right', 'Backward', 'Left'])
+THIRDS = np.array(['Defensive', 'Middle', 'Final'])
+
+
+def pass_arrays(locations, details, teams=None, players=None, match_ids=None):
+    """
+    Build the raw pass arrays from per-pass locations and 'pass' objects.
+
+    This is the only per-pass Python loop; everything else works on arrays.
+    """
+    locations = list(locations)
+    details = list(details)
+    n = len(details)
+    start = np.array(locations, dtype=np.float64).reshape(n, 2) if n else np.zeros((0, 2))
+    end = np.array([d.get('end_location', (np.nan, np.nan))[:2] for d in details],
+                   dtype=np.float64).reshape(n, 2)
+    outcome = np.array([d['outcome']['name'] if 'outcome' in d else 'Complete' for d in details],
+                       dtype=object)
+    return {
+        'x': start[:, 0], 'y': start[:, 1],
+        'end_x': end[:, 0], 'end_y': end[:, 1],
+        'outcome': outcome,
+        'team': np.array(list(teams) if teams is not None else [None] * n, dtype=object),
+        'player': np.array(list(players) if players is not None else [None] * n, dtype=object),
+        'match_id': np.array(list(match_ids) if match_ids is not None else [0] * n, dtype=np.int64),
+    }
+
+
+def extract_passes(events, match_id=0):
+    """Pass arrays from a list of normalized events."""
+    passes = [e for e in events if e['type']['name'] == 'Pass' and e['location'] is not None]
+    return pass_arrays((e['location'] for e in passes),
+                       (e['pass'] for e in passes),
+                       (e['team']['name'] for e in passes),
+                       (e['player']['name'] for e in passes),
+                       [match_id] * len(passes))
+
+
+def concat_passes(batches):
+    """Concatenate pass arrays from several matches."""
+    batches = list(batches)
+    return {key: np.concatenate([b[key] for b in batches]) for key in batches[0]}
+
+
+def third_of(x):
+    """Pitch third (0 defensive, 1 middle, 2 final) of x coordinates."""
+    return np.clip((np.asarray(x) * 3 // PITCH_LENGTH).astype(np.int64), 0, 2)
+
+
+def zone_of(x, y):
+    """Zone index on a ZONE_COLUMNS x ZONE_ROWS grid (row-major by column)."""
+    col = np.clip((np.asarray(x) * ZONE_COLUMNS // PITCH_LENGTH).astype(np.int64), 0, ZONE_COLUMNS - 1)
+    row = np.clip((np.asarray(y) * ZONE_ROWS // PITCH_WIDTH).astype(np.int64), 0, ZONE_ROWS - 1)
+    return col * ZONE_ROWS + row
+
+
+def pass_geometry(passes):
+    """Derive all pass metrics from the raw arrays in one vectorized pass."""
+    dx = passes['end_x'] - passes['x']
+    dy = passes['end_y'] - passes['y']
+    valid = ~(np.isnan(dx) | np.isnan(dy))
+    end_x = np.where(valid, passes['end_x'], passes['x'])
+    end_y = np.where(valid, passes['end_y'], passes['y'])
+
+    length = np.hypot(dx, dy)
+    angle = np.arctan2(dy, dx)
+    # 0 forward, 1 right, 2 backward, 3 left (quadrants centred on each direction)
+    quadrant = ((np.nan_to_num(angle) + np.pi / 4) // (np.pi / 2)).astype(np.int64) % 4
+    direction = np.where(valid, quadrant, -1)
+
+    start_goal = np.hypot(GOAL[0] - passes['x'], GOAL[1] - passes['y'])
+    end_goal = np.hypot(GOAL[0] - end_x, GOAL[1] - end_y)
+    progress = start_goal - end_goal
+
+    start_third = third_of(passes['x'])
+    end_third = third_of(end_x)
+    completed = passes['outcome'] == 'Complete'
+
+    return {
+        'length': length,
+        'angle': angle,
+        'direction': direction,
+        'progress': progress,
+        'progressive': valid & (end_goal <= (1 - PROGRESSIVE_FRACTION) * start_goal),
+        'start_third': start_third,
+        'end_third': end_third,
+        'third_transition': start_third * 3 + end_third,
+        'start_zone': zone_of(passes['x'], passes['y']),
+        'end_zone': zone_of(end_x, end_y),
+        'final_third_entry': valid & (start_third < 2) & (end_third == 2),
+        'completed': completed,
+    }
+
+
+def pass_breakdown(passes, geometry=None, by='team'):
+    """Per-team (or per-player) pass summary computed with bincount."""
+    geometry = pass_geometry(passes) if geometry is None else geometry
+    keys, codes = np.unique(passes[by].astype(str), return_inverse=True)
+    size = len(keys)
+
+    def total(values):
+        return np.bincount(codes, weights=values, minlength=size)
+
+    count = np.bincount(codes, minlength=size)
+    completed = geometry['completed']
+    table = pd.DataFrame({
+        'passes': count,
+        'completed': total(completed).astype(np.int64),
+        'completion_pct': 100 * total(completed) / np.maximum(count, 1),
+        'mean_length': total(np.nan_to_num(geometry['length'])) / np.maximum(count, 1),
+        'progressive': total(geometry['progressive'] & completed).astype(np.int64),
+        'final_third_entries': total(geometry['final_third_entry'] & completed).astype(np.int64),
+        'progress_m': total(np.nan_to_num(geometry['progress']) * completed),
+    }, index=pd.Index(keys, name=by))
+    for code, name in enumerate(DIRECTIONS):
+        table[name.lower()] = total(geometry['direction'] == code).astype(np.int64)
+    return table
+
+
+def third_transitions(geometry):
+    """3 x 3 matrix of pass counts from start third (rows) to end third (columns)."""
+    counts = np.bincount(geometry['third_transition'], minlength=9)
+    return pd.DataFrame(counts.reshape(3, 3), index=THIRDS, columns=THIRDS)
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    batches = []
+    for path in paths:
+        events, _ = load_events(path)
+        batches.append(extract_passes(events, match_id_from_path(path)))
+    passes = concat_passes(batches)
+    geometry = pass_geometry(passes)
+
+    print(f"✓ {len(passes['x']):,} passes from {len(paths)} match(es)\n")
+    with pd.option_context('display.width', 160, 'display.precision', 1):
+        print(pass_breakdown(passes, geometry))
+        print("\nThird transitions (start → end):")
+        print(third_transitions(geometry))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Cached Pitch Rendering
+======================================================
+
+Draws the 120 x 80 StatsBomb pitch markings once per figure size, DPI and
+style, keeps the rasterized background and blits only the data layers
+(scatter points, heatmaps, arrows) on top of it for every chart. Producing
+many shot maps or heatmaps then costs one restore and a few artist draws
+each, instead of building and rasterizing a full figure per chart.
+
+Renderers are cached, so any module asking for the same size and style
+shares one background.
+
+Usage:
+    python pitch_render.py
+    python pitch_render.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Arc, Circle, Rectangle
+import matplotlib.image as mpimg
+
+from normalize import load_events
+from event_store import match_id_from_path
+from pass_engine import PITCH_LENGTH, PITCH_WIDTH
+
+# Configuration
+DATA_FILES = ['19736.json']
+OUTPUT_DIR = 'output'
+FIGSIZE = (12, 8)
+DPI = 100
+CACHE_SIZE = 8
+STYLES = {
+    'grass': {'pitch': '#3a7d44', 'lines': 'white', 'text': 'black'},
+    'light': {'pitch': 'white', 'lines': '#555555', 'text': 'black'},
+    'dark': {'pitch': '#22312b', 'lines': '#c7d5cc', 'text': 'white'},
+}
+
+
+def draw_markings(ax, lines, linewidth=1.5):
+    """Pitch outline, halfway line, circles, boxes, spots and goals in pitch units."""
+    def rect(x, y, width, height):
+        ax.add_patch(Rectangle((x, y), width, height, fill=False, edgecolor=lines, linewidth=linewidth))
+
+    rect(0, 0, PITCH_LENGTH, PITCH_WIDTH)
+    ax.plot([PITCH_LENGTH / 2] * 2, [0, PITCH_WIDTH], color=lines, linewidth=linewidth)
+    ax.add_patch(Circle((PITCH_LENGTH / 2, PITCH_WIDTH / 2), 10, fill=False,
+                        edgecolor=lines, linewidth=linewidth))
+    for x, spot, side in ((0, 12, 1), (PITCH_LENGTH, PITCH_LENGTH - 12, -1)):
+        rect(x, 18, side * 18, 44)                         # penalty area
+        rect(x, 30, side * 6, 20)                          # six-yard box
+        rect(x, 36, -side * 2, 8)                          # goal
+        ax.add_patch(Circle((spot, PITCH_WIDTH / 2), 0.4, color=lines))
+        # Arc outside the box: the part of the 10-unit circle beyond x = 18
+        ax.add_patch(Arc((spot, PITCH_WIDTH / 2), 20, 20, theta1=-53 if side == 1 else 127,
+                         theta2=53 if side == 1 else 233, edgecolor=lines, linewidth=linewidth))
+    ax.add_patch(Circle((PITCH_LENGTH / 2, PITCH_WIDTH / 2), 0.4, color=lines))
+
+
+class PitchRenderer:
+    """One pitch figure whose rasterized background is reused for every chart."""
+
+    def __init__(self, figsize=FIGSIZE, dpi=DPI, style='grass'):
+        if style not in STYLES:
+            raise ValueError(f"unknown pitch style '{style}' (choose from {', '.join(STYLES)})")
+        self.colors = STYLES[style]
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor=self.colors['pitch'])
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_axes((0.03, 0.03, 0.94, 0.88))
+        self.ax.set_facecolor(self.colors['pitch'])
+        draw_markings(self.ax, self.colors['lines'])
+        # y increases down the image, as in StatsBomb coordinates
+        self.ax.set_xlim(-3, PITCH_LENGTH + 3)
+        self.ax.set_ylim(PITCH_WIDTH + 3, -3)
+        self.ax.set_aspect('equal')
+        self.ax.axis('off')
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def begin(self, title=None):
+        """Start a new chart: restore the cached background and draw the title."""
+        self.canvas.restore_region(self.background)
+        if title:
+            self._draw(self.figure.text(0.5, 0.95, title, ha='center', va='center', fontsize=14,
+                                        fontweight='bold', color=self.colors['text']))
+        return self
+
+    def _draw(self, artist):
+        artist.set_animated(True)
+        self.figure.draw_artist(artist)
+        artist.remove()
+        return self
+
+    def scatter(self, x, y, **kwargs):
+        """Blit a scatter layer (kwargs go to Axes.scatter)."""
+        kwargs.setdefault('zorder', 3)
+        return self._draw(self.ax.scatter(x, y, **kwargs))
+
+    def heatmap(self, grid, cmap='YlOrRd', alpha=0.75, **kwargs):
+        """Blit a (rows across the width, columns along the length) grid over the pitch."""
+        image = self.ax.imshow(grid, extent=(0, PITCH_LENGTH, PITCH_WIDTH, 0), cmap=cmap,
+                               alpha=alpha, interpolation='bilinear', aspect='auto', **kwargs)
+        return self._draw(image)
+
+    def arrows(self, x, y, end_x, end_y, color=None, **kwargs):
+        """Blit start -> end arrows (kwargs go to Axes.quiver)."""
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        quiver = self.ax.quiver(x, y, np.asarray(end_x) - x, np.asarray(end_y) - y,
+                                angles='xy', scale_units='xy', scale=1, width=0.002,
+                                color=color or self.colors['lines'], **kwargs)
+        return self._draw(quiver)
+
+    def image(self):
+        """Current chart as an (height, width, 4) RGBA array (a copy)."""
+        return np.array(self.canvas.buffer_rgba())
+
+    def save(self, path):
+        """Write the current chart to a PNG file."""
+        mpimg.imsave(path, self.canvas.buffer_rgba())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pitch_renderer(figsize=FIGSIZE, dpi=DPI, style='grass'):
+    """Shared renderer for a size, DPI and style (figsize must be a tuple)."""
+    return PitchRenderer(tuple(figsize), dpi, style)
+
+
+def _team_layers(events):
+    """Shot and pass-origin arrays per team."""
+    layers = {}
+    for team in sorted({e['team']['name'] for e in events}):
+        shots = [e for e in events if e['team']['name'] == team
+                 and e['type']['name'] == 'Shot' and e['location'] is not None]
+        passes = [e['location'][:2] for e in events if e['team']['name'] == team
+                  and e['type']['name'] == 'Pass' and e['location'] is not None]
+        shot_xy = np.array([e['location'][:2] for e in shots], dtype=np.float64).reshape(-1, 2)
+        shot_end = np.array([e['shot'].get('end_location', e['location'])[:2] for e in shots],
+                            dtype=np.float64).reshape(-1, 2)
+        xg = np.array([e['shot'].get('statsbomb_xg', 0.05) for e in shots], dtype=np.float64)
+        goals = np.array([e['shot'].get('outcome', {}).get('name') == 'Goal' for e in shots], dtype=bool)
+        pass_xy = np.array(passes, dtype=np.float64).reshape(-1, 2)
+        grid, _, _ = np.histogram2d(pass_xy[:, 1], pass_xy[:, 0], bins=(16, 24),
+                                    range=((0, PITCH_WIDTH), (0, PITCH_LENGTH)))
+        layers[team] = (shot_xy, shot_end, xg, goals, grid)
+    return layers
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    out_dir = os.path.join(OUTPUT_DIR, 'pitch_maps')
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    charts = 0
+    for path in paths:
+        events, _ = load_events(path)
+        match_id = match_id_from_path(path)
+        for team, (shot_xy, shot_end, xg, goals, grid) in _team_layers(events).items():
+            renderer = pitch_renderer()
+            renderer.begin(f'{team} - Shots ({match_id})')
+            renderer.arrows(shot_xy[:, 0], shot_xy[:, 1], shot_end[:, 0], shot_end[:, 1], alpha=0.4)
+            renderer.scatter(shot_xy[:, 0], shot_xy[:, 1], s=1500 * xg,
+                             c=np.where(goals, 'gold', 'white'), edgecolors='black')
+            renderer.save(os.path.join(out_dir, f'{match_id}_{team}_shots.png'))
+
+            renderer.begin(f'{team} - Pass Origins ({match_id})')
+            renderer.heatmap(grid)
+            renderer.save(os.path.join(out_dir, f'{match_id}_{team}_passes.png'))
+            charts += 2
+    elapsed = time.perf_counter() - start
+    print(f"✓ {charts} pitch maps saved to '{out_dir}/' in {elapsed:.2f}s "
+          f"({1000 * elapsed / max(charts, 1):.0f} ms per chart, including loading)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Minutes Played and Per-90 Stats
+===============================================================
+
+Builds an on-pitch interval model for every player once per match from the
+'Starting XI' lineups, substitutions, temporary 'Player Off'/'Player On'
+events and red cards. Intervals are stored as NumPy arrays on a continuous
+match clock (seconds, periods placed back to back), so minutes played,
+"who was on the pitch at t" queries, per-90 normalisation and on/off splits
+are all vectorized.
+
+Usage:
+    python playing_time.py
+    python playing_time.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+from normalize import load_events
+from event_store import parse_clock
+
+# Configuration
+DATA_FILES = ['19736.json']
+MIN_MINUTES = 30                 # players below this are left out of per-90 rankings
+LAST_PLAYED_PERIOD = 4           # period 5 is the penalty shoot-out
+SENDING_OFF_CARDS = ('Red Card', 'Second Yellow')
+
+# Event types that can change who is on the pitch (plus period ends)
+INTERVAL_EVENT_TYPES = ('Starting XI', 'Substitution', 'Player Off', 'Player On',
+                        'Foul Committed', 'Bad Behaviour', 'Half End')
+
+
+def parse_clocks(timestamps):
+    """Convert 'HH:MM:SS.mmm' timestamps to seconds, vectorized."""
+    parts = np.char.split(np.asarray(timestamps, dtype=str), ':')
+    hms = np.array(parts.tolist(), dtype=np.float64).reshape(-1, 3)
+    return hms[:, 0] * 3600 + hms[:, 1] * 60 + hms[:, 2]
+
+
+def period_starts(events):
+    """Match-clock offset of each period and the total match length."""
+    half_end = {}
+    latest = {}
+    for event in events:
+        period = event['period']
+        seconds = parse_clock(event['timestamp'])
+        latest[period] = max(latest.get(period, 0.0), seconds)
+        if event['type']['name'] == 'Half End':
+            half_end[period] = max(half_end.get(period, 0.0), seconds)
+
+    starts = {}
+    offset = 0.0
+    for period in sorted(latest):
+        starts[period] = offset
+        offset += half_end.get(period, latest[period])
+    return starts, offset
+
+
+def event_clock(periods, timestamps, starts):
+    """Continuous match clock in seconds for arrays of periods and timestamps."""
+    periods = np.asarray(periods, dtype=np.int64)
+    lookup = np.zeros(max(starts, default=0) + 2, dtype=np.float64)
+    for period, start in starts.items():
+        lookup[period] = start
+    return lookup[np.clip(periods, 0, len(lookup) - 1)] + parse_clocks(timestamps)
+
+
+def _sent_off(event):
+    for field in ('foul_committed', 'bad_behaviour'):
+        card = event.get(field, {}).get('card', {}).get('name')
+        if card in SENDING_OFF_CARDS:
+            return True
+    return False
+
+
+class PlayingTime:
+    """On-pitch intervals for one match: one row per continuous spell."""
+
+    def __init__(self, events):
+        events = [e for e in events if e['period'] <= LAST_PLAYED_PERIOD]
+        self.starts, self.match_end = period_starts(events)
+        events = [e for e in events if e['type']['name'] in INTERVAL_EVENT_TYPES]
+
+        self.player_names = []
+        self.player_teams = []
+        self._codes = {}
+        spells = []
+        open_spells = {}
+
+        def code(player, team):
+            if player not in self._codes:
+                self._codes[player] = len(self.player_names)
+                self.player_names.append(player)
+                self.player_teams.append(team)
+            return self._codes[player]
+
+        def enter(player, team, t):
+            open_spells.setdefault(code(player, team), t)
+
+        def leave(player, team, t):
+            start = open_spells.pop(code(player, team), None)
+            if start is not None:
+                spells.append((self._codes[player], start, t))
+
+        for event in events:
+            t = self.starts.get(event['period'], 0.0) + parse_clock(event['timestamp'])
+            team = event['team']['name']
+            player = event['player']['name']
+            name = event['type']['name']
+            if name == 'Starting XI':
+                for slot in event['tactics'].get('lineup', []):
+                    enter(slot['player']['name'], team, 0.0)
+            elif name == 'Substitution':
+                leave(player, team, t)
+                enter(event['substitution']['replacement']['name'], team, t)
+            elif name == 'Player Off':
+                leave(player, team, t)
+            elif name == 'Player On':
+                enter(player, team, t)
+            elif player is not None and _sent_off(event):
+                leave(player, team, t)
+
+        for player_code, start in open_spells.items():
+            spells.append((player_code, start, self.match_end))
+
+        spells = np.array(spells, dtype=np.float64).reshape(-1, 3)
+        self.spell_player = spells[:, 0].astype(np.int64)
+        self.spell_start = spells[:, 1]
+        self.spell_end = spells[:, 2]
+        self.player_names = np.array(self.player_names, dtype=object)
+        self.player_teams = np.array(self.player_teams, dtype=object)
+
+    def __len__(self):
+        return len(self.player_names)
+
+    def code(self, player):
+        """Player code, or -1 for players who never took the pitch."""
+        return self._codes.get(player, -1)
+
+    def minutes(self):
+        """Minutes played per player code."""
+        seconds = np.bincount(self.spell_player, weights=self.spell_end - self.spell_start,
+                              minlength=len(self))
+        return seconds / 60.0
+
+    def on_pitch_matrix(self, times):
+        """Boolean (len(times), players) matrix: was player p on the pitch at t."""
+        times = np.asarray(times, dtype=np.float64)[:, None]
+        on_spell = (self.spell_start <= times) & (times < self.spell_end)
+        on = np.zeros((len(times), len(self)), dtype=bool)
+        rows, spells = np.nonzero(on_spell)
+        on[rows, self.spell_player[spells]] = True
+        return on
+
+    def on_pitch(self, t):
+        """Names of the players on the pitch at match-clock second t."""
+        return list(self.player_names[self.on_pitch_matrix([t])[0]])
+
+    def clock(self, events):
+        """Continuous match clock of each event."""
+        return event_clock([e['period'] for e in events],
+                           [e['timestamp'] for e in events], self.starts)
+
+
+def per90_table(events, model=None, event_type=None):
+    """Per-player event totals, minutes and per-90 rates for one match."""
+    model = PlayingTime(events) if model is None else model
+    if event_type is not None:
+        events = [e for e in events if e['type']['name'] == event_type]
+    codes = np.array([model.code(e['player']['name']) for e in events], dtype=np.int64)
+    counts = np.bincount(codes[codes >= 0], minlength=len(model))
+    minutes = model.minutes()
+    return pd.DataFrame({
+        'team': model.player_teams,
+        'minutes': minutes,
+        'events': counts,
+        'per90': np.where(minutes > 0, counts * 90.0 / np.maximum(minutes, 1e-9), 0.0),
+    }, index=pd.Index(model.player_names, name='player'))
+
+
+def on_off_split(events, model=None, event_type='Shot'):
+    """
+    Team events for and against per 90 while each player was on / off the pitch.
+    """
+    model = PlayingTime(events) if model is None else model
+    selected = [e for e in events if e['type']['name'] == event_type
+                and e['period'] <= LAST_PLAYED_PERIOD]
+    times = model.clock(selected)
+    teams = np.array([e['team']['name'] for e in selected], dtype=object)
+
+    on = model.on_pitch_matrix(times)                       # (events, players)
+    same_team = teams[:, None] == model.player_teams[None, :]
+    for_on = (on & same_team).sum(axis=0)
+    for_off = (~on & same_team).sum(axis=0)
+    against_on = (on & ~same_team).sum(axis=0)
+    against_off = (~on & ~same_team).sum(axis=0)
+
+    on_minutes = model.minutes()
+    off_minutes = model.match_end / 60.0 - on_minutes
+
+    def rate(count, minutes):
+        return np.where(minutes > 0, count * 90.0 / np.maximum(minutes, 1e-9), np.nan)
+
+    return pd.DataFrame({
+        'team': model.player_teams,
+        'on_minutes': on_minutes,
+        'off_minutes': off_minutes,
+        'for_on_per90': rate(for_on, on_minutes),
+        'for_off_per90': rate(for_off, off_minutes),
+        'against_on_per90': rate(against_on, on_minutes),
+        'against_off_per90': rate(against_off, off_minutes),
+    }, index=pd.Index(model.player_names, name='player'))
+
+
+def season_per90(paths, event_type=None):
+    """Sum per-match tables into season totals and recompute per-90 rates."""
+    tables = []
+    for path in paths:
+        events, _ = load_events(path)
+        tables.append(per90_table(events, event_type=event_type).reset_index())
+    season = pd.concat(tables).groupby(['player', 'team'], as_index=False)[['minutes', 'events']].sum()
+    season['per90'] = season['events'] * 90.0 / season['minutes'].where(season['minutes'] > 0)
+    return season.set_index('player')
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    table = season_per90(paths)
+    ranked = table[table['minutes'] >= MIN_MINUTES].sort_values('per90', ascending=False)
+    print(f"✓ {len(table)} players, {len(paths)} match(es)\n")
+    print(f"Top 20 players by events per 90 (min. {MIN_MINUTES} minutes):")
+    for i, (player, row) in enumerate(ranked.head(20).iterrows(), 1):
+        print(f"  {i:2d}. {player:35s} ({row['team']:12s}) "
+              f"{row['minutes']:5.0f} min  {row['per90']:6.1f} per 90")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Pressing and Defensive Intensity
+================================================================
+
+Computes PPDA (opponent passes allowed per defensive action), pressure
+counts, ball regains and high turnovers per team, by pitch third and by
+rolling time window. All metrics are vectorized masks and bincounts over
+flat event arrays, so one match or a whole batch of matches is processed
+without looping over events.
+
+StatsBomb coordinates are given from the acting team's point of view
+(attacking towards x = 120); defensive locations are therefore in the
+defending team's own frame.
+
+Usage:
+    python pressing.py
+    python pressing.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+from normalize import load_events
+from event_store import match_id_from_path
+from pass_engine import third_of, THIRDS, PITCH_LENGTH
+from playing_time import period_starts, event_clock
+
+# Configuration
+DATA_FILES = ['19736.json']
+PPDA_LINE = 0.6 * PITCH_LENGTH            # opponent passes in their own 60% count for PPDA
+HIGH_TURNOVER_LINE = PITCH_LENGTH - 40.0  # regains within 40m of the opponent's goal
+WINDOW_MINUTES = 15
+DEFENSIVE_ACTION_TYPES = ('Interception', 'Foul Committed', 'Dribbled Past')
+TACKLE_DUEL = 'Tackle'
+# Possessions restarted from a dead ball are not regains
+SET_PIECE_PATTERNS = ('From Throw In', 'From Goal Kick', 'From Kick Off', 'From Corner', 'From Free Kick')
+SET_PIECE_PASSES = ('Throw-in', 'Goal Kick', 'Kick Off', 'Corner', 'Free Kick')
+RESTART_TYPE = 'Referee Ball-Drop'
+
+
+def pressing_arrays(events, match_id=0):
+    """Flatten one normalized match into the arrays the engine works on."""
+    starts, _ = period_starts(events)
+    nan = (np.nan, np.nan)
+    xy = np.array([e['location'][:2] if e['location'] is not None else nan for e in events],
+                  dtype=np.float64).reshape(-1, 2)
+    types = np.array([e['type']['name'] for e in events], dtype=object)
+    duel_tackle = np.array([e.get('duel', {}).get('type', {}).get('name') == TACKLE_DUEL
+                            for e in events], dtype=bool)
+    return {
+        'match_id': np.full(len(events), match_id, dtype=np.int64),
+        'team': np.array([e['team']['name'] for e in events], dtype=object),
+        'possession_team': np.array([e['possession_team']['name'] for e in events], dtype=object),
+        'possession': np.array([e['possession'] for e in events], dtype=np.int64),
+        'play_pattern': np.array([e['play_pattern']['name'] for e in events], dtype=object),
+        'pass_type': np.array([e.get('pass', {}).get('type', {}).get('name') for e in events], dtype=object),
+        'type': types,
+        'x': xy[:, 0],
+        'y': xy[:, 1],
+        'minute': event_clock([e['period'] for e in events],
+                              [e['timestamp'] for e in events], starts) / 60.0,
+        'defensive_action': np.isin(types, DEFENSIVE_ACTION_TYPES) | duel_tackle,
+    }
+
+
+def concat_arrays(batches):
+    """Concatenate arrays from several matches."""
+    batches = list(batches)
+    return {key: np.concatenate([b[key] for b in batches]) for key in batches[0]}
+
+
+def _labels(arrays, field):
+    return np.char.add(np.char.add(arrays['match_id'].astype(str), '\x1f'),
+                       arrays[field].astype(str))
+
+
+def _groups(arrays):
+    """
+    (match, team) group codes of each event's team and possession team,
+    the opponent of every group and the matching DataFrame index.
+    """
+    keys, codes = np.unique(_labels(arrays, 'team'), return_inverse=True)
+    possession_labels = _labels(arrays, 'possession_team')
+    position = np.clip(np.searchsorted(keys, possession_labels), 0, max(len(keys) - 1, 0))
+    possession_codes = np.where(keys[position] == possession_labels, position, -1) \
+        if len(keys) else np.zeros(0, dtype=np.int64)
+
+    match_of_key = np.array([int(k.split('\x1f')[0]) for k in keys], dtype=np.int64)
+    team_of_key = np.array([k.split('\x1f')[1] for k in keys], dtype=object)
+    # Each match has two teams: the opponent is the other key of the same match
+    opponent = np.full(len(keys), -1, dtype=np.int64)
+    for match in np.unique(match_of_key):
+        pair = np.nonzero(match_of_key == match)[0]
+        if len(pair) == 2:
+            opponent[pair[0]], opponent[pair[1]] = pair[1], pair[0]
+    index = pd.MultiIndex.from_arrays([match_of_key, team_of_key], names=['match_id', 'team'])
+    return codes, possession_codes, opponent, index
+
+
+def regains(arrays):
+    """
+    Mask of open-play possession starts where the ball changed team, with
+    the regain location expressed in the regaining team's frame. Restarts
+    (throw-ins, goal kicks, kick-offs, corners, free kicks, drop balls)
+    are left out.
+    """
+    same_match = np.r_[False, arrays['match_id'][1:] == arrays['match_id'][:-1]]
+    new_possession = np.r_[True, arrays['possession'][1:] != arrays['possession'][:-1]]
+    switched = np.r_[False, arrays['possession_team'][1:] != arrays['possession_team'][:-1]]
+    set_piece = (np.isin(arrays['play_pattern'], SET_PIECE_PATTERNS)
+                 | np.isin(arrays['pass_type'], SET_PIECE_PASSES)
+                 | (arrays['type'] == RESTART_TYPE))
+    mask = same_match & new_possession & switched & ~set_piece & ~np.isnan(arrays['x'])
+    # Events by the other side are recorded in their own frame: mirror them
+    flip = arrays['team'] != arrays['possession_team']
+    x = np.where(flip, PITCH_LENGTH - arrays['x'], arrays['x'])
+    return mask, x
+
+
+def _possessions_with_shot(arrays):
+    """Per-event flag: does this event's possession contain a shot."""
+    keys = arrays['match_id'] * 100000 + arrays['possession']
+    unique, inverse = np.unique(keys, return_inverse=True)
+    has_shot = np.bincount(inverse, weights=arrays['type'] == 'Shot', minlength=len(unique)) > 0
+    return has_shot[inverse]
+
+
+def pressing_summary(arrays):
+    """PPDA, pressures by third, regains and high turnovers per (match, team)."""
+    codes, possession_codes, opponent, index = _groups(arrays)
+    size = len(index)
+    x = arrays['x']
+
+    def count(mask, group=codes):
+        mask = mask & (group >= 0)
+        return np.bincount(group[mask], minlength=size)
+
+    # Opponent passes in their own 60% are credited to the defending (other) team
+    opponent_code = opponent[codes]
+    ppda_passes = count((arrays['type'] == 'Pass') & (x < PPDA_LINE), opponent_code)
+    ppda_actions = count(arrays['defensive_action'] & (x >= PITCH_LENGTH - PPDA_LINE))
+
+    pressure = arrays['type'] == 'Pressure'
+    pressure_third = third_of(np.nan_to_num(x))
+    regain_mask, regain_x = regains(arrays)
+    high = regain_mask & (regain_x >= HIGH_TURNOVER_LINE)
+
+    table = pd.DataFrame({
+        'ppda': np.where(ppda_actions > 0, ppda_passes / np.maximum(ppda_actions, 1), np.nan),
+        'opp_passes': ppda_passes,
+        'defensive_actions': ppda_actions,
+        'pressures': count(pressure),
+    }, index=index)
+    for third, name in enumerate(THIRDS):
+        table[f'pressures_{name.lower()}'] = count(pressure & (pressure_third == third))
+    table['regains'] = count(regain_mask, possession_codes)
+    table['high_turnovers'] = count(high, possession_codes)
+    table['high_turnover_shots'] = count(high & _possessions_with_shot(arrays), possession_codes)
+    table['high_turnover_pct'] = 100 * table['high_turnovers'] / table['regains'].where(table['regains'] > 0)
+    return table
+
+
+def rolling_pressing(arrays, window=WINDOW_MINUTES):
+    """
+    Rolling pressures, defensive actions, regains and PPDA per (match, team, minute).
+
+    Each row covers the `window` minutes ending at that minute.
+    """
+    codes, possession_codes, opponent, index = _groups(arrays)
+    size = len(index)
+    minutes = int(np.nanmax(arrays['minute'])) + 1 if len(arrays['minute']) else 0
+    minute = np.clip(np.nan_to_num(arrays['minute']).astype(np.int64), 0, max(minutes - 1, 0))
+    x = arrays['x']
+
+    def per_minute(mask, group=codes):
+        mask = mask & (group >= 0)
+        flat = group[mask] * minutes + minute[mask]
+        return np.bincount(flat, minlength=size * minutes).reshape(size, minutes)
+
+    def rolling(counts):
+        cumulative = np.cumsum(counts, axis=1)
+        shifted = np.zeros_like(cumulative)
+        if window < minutes:
+            shifted[:, window:] = cumulative[:, :-window]
+        return cumulative - shifted
+
+    regain_mask, _ = regains(arrays)
+    passes = rolling(per_minute((arrays['type'] == 'Pass') & (x < PPDA_LINE), opponent[codes]))
+    actions = rolling(per_minute(arrays['defensive_action'] & (x >= PITCH_LENGTH - PPDA_LINE)))
+    pressures = rolling(per_minute(arrays['type'] == 'Pressure'))
+    regained = rolling(per_minute(regain_mask, possession_codes))
+
+    rows = pd.MultiIndex.from_tuples(
+        [(m, t, k) for (m, t) in index for k in range(minutes)],
+        names=['match_id', 'team', 'minute'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ppda = np.where(actions > 0, passes / actions, np.nan)
+    return pd.DataFrame({
+        'pressures': pressures.ravel(),
+        'defensive_actions': actions.ravel(),
+        'opp_passes': passes.ravel(),
+        'regains': regained.ravel(),
+        'ppda': ppda.ravel(),
+    }, index=rows)
+
+
+def load_arrays(paths):
+    """Pressing arrays for a batch of match files."""
+    batches = []
+    for path in paths:
+        events, _ = load_events(path)
+        batches.append(pressing_arrays(events, match_id_from_path(path)))
+    return concat_arrays(batches)
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    arrays = load_arrays(paths)
+    summary = pressing_summary(arrays)
+    print("="*80)
+    print("PRESSING AND DEFENSIVE INTENSITY")
+    print("="*80)
+    with pd.option_context('display.width', 160, 'display.max_columns', 20, 'display.precision', 1):
+        print(summary)
+
+    rolling = rolling_pressing(arrays)
+    print(f"\nMost intense {WINDOW_MINUTES}-minute pressing spells:")
+    top = rolling.sort_values('pressures', ascending=False).head(5)
+    for (match_id, team, minute), row in top.iterrows():
+        print(f"  • {match_id} {team:20s} minutes {max(minute - WINDOW_MINUTES + 1, 0):3d}-{minute:3d}: "
+              f"{row['pressures']:3.0f} pressures, PPDA {row['ppda']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
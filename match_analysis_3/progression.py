@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Ball Progression
+================================================
+
+Treats passes and carries (carry.end_location) as one set of start/end
+vectors and measures how teams and players move the ball: progressive
+actions, final third and penalty box entries, and expected-threat (xT)
+style value gained on a zone grid. The zone values are computed once (by
+value iteration over shot, goal and move rates per zone) and saved, then
+every action is scored with two array lookups. All totals are bincounts
+per team or player over every loaded match.
+
+Usage:
+    python progression.py
+    python progression.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+from normalize import load_events
+from event_store import match_id_from_path
+from pass_engine import pass_geometry, concat_passes, PITCH_LENGTH, PITCH_WIDTH
+
+# Configuration
+DATA_FILES = ['19736.json']
+OUTPUT_DIR = 'output'
+THREAT_FILE = 'threat_grid.npz'
+GRID_COLUMNS = 12                 # xT zones along the pitch length
+GRID_ROWS = 8                     # xT zones across the pitch width
+THREAT_ITERATIONS = 30
+BOX_DEPTH = 18.0
+BOX_WIDTH = 44.0
+ACTION_TYPES = {'Pass': 'pass', 'Carry': 'carry'}
+
+
+def action_arrays(events, match_id=0):
+    """
+    Start/end arrays for passes, carries and shots of one normalized match.
+
+    Failed passes keep their outcome name; carries always count as complete.
+    """
+    actions = [e for e in events if e['location'] is not None
+               and (e['type']['name'] in ACTION_TYPES or e['type']['name'] == 'Shot')]
+    n = len(actions)
+    nan = (np.nan, np.nan)
+    start = np.array([e['location'][:2] for e in actions], dtype=np.float64).reshape(n, 2)
+    end = np.array([e[ACTION_TYPES[e['type']['name']]].get('end_location', nan)[:2]
+                    if e['type']['name'] in ACTION_TYPES else nan for e in actions],
+                   dtype=np.float64).reshape(n, 2)
+    kind = np.array([e['type']['name'] for e in actions], dtype=object)
+    outcome = np.array([e['pass']['outcome']['name'] if 'outcome' in e.get('pass', {}) else 'Complete'
+                        for e in actions], dtype=object)
+    goal = np.array([e['type']['name'] == 'Shot'
+                     and e['shot'].get('outcome', {}).get('name') == 'Goal' for e in actions], dtype=bool)
+    return {
+        'x': start[:, 0], 'y': start[:, 1],
+        'end_x': end[:, 0], 'end_y': end[:, 1],
+        'kind': kind,
+        'outcome': outcome,
+        'goal': goal,
+        'team': np.array([e['team']['name'] for e in actions], dtype=object),
+        'player': np.array([e['player']['name'] or '' for e in actions], dtype=object),
+        'match_id': np.full(n, match_id, dtype=np.int64),
+    }
+
+
+def cell_of(x, y):
+    """Cell index on the GRID_COLUMNS x GRID_ROWS threat grid (row-major by row)."""
+    col = np.clip((np.nan_to_num(x) * GRID_COLUMNS // PITCH_LENGTH).astype(np.int64), 0, GRID_COLUMNS - 1)
+    row = np.clip((np.nan_to_num(y) * GRID_ROWS // PITCH_WIDTH).astype(np.int64), 0, GRID_ROWS - 1)
+    return row * GRID_COLUMNS + col
+
+
+def in_box(x, y):
+    """Inside the attacked penalty area."""
+    return (x >= PITCH_LENGTH - BOX_DEPTH) & (np.abs(y - PITCH_WIDTH / 2) <= BOX_WIDTH / 2)
+
+
+def fit_threat_grid(arrays, iterations=THREAT_ITERATIONS):
+    """
+    Expected-threat grid (GRID_ROWS, GRID_COLUMNS) by value iteration:
+    value = P(shoot) * P(goal | shot) + P(move) * sum(P(move to c') * value[c']).
+    """
+    cells = GRID_ROWS * GRID_COLUMNS
+    shot = arrays['kind'] == 'Shot'
+    move = ~shot & ~np.isnan(arrays['end_x'])
+    start = cell_of(arrays['x'], arrays['y'])
+    end = cell_of(arrays['end_x'], arrays['end_y'])
+    completed = move & (arrays['outcome'] == 'Complete')
+
+    shots = np.bincount(start[shot], minlength=cells)
+    goals = np.bincount(start[shot & arrays['goal']], minlength=cells)
+    moves = np.bincount(start[move], minlength=cells)
+    total = np.maximum(shots + moves, 1)
+    shoot_rate = shots / total
+    move_rate = moves / total
+    goal_rate = goals / np.maximum(shots, 1)
+
+    # Transition matrix: failed moves lose the ball, so rows sum to the completion rate
+    transitions = np.zeros((cells, cells))
+    np.add.at(transitions, (start[completed], end[completed]), 1.0)
+    transitions /= np.maximum(moves, 1)[:, None]
+
+    value = np.zeros(cells)
+    for _ in range(iterations):
+        value = shoot_rate * goal_rate + move_rate * (transitions @ value)
+    return value.reshape(GRID_ROWS, GRID_COLUMNS)
+
+
+def save_threat_grid(grid, path, match_ids):
+    """Save a grid with the ids of the matches it was fitted on."""
+    np.savez(path, grid=grid, match_ids=np.unique(np.asarray(match_ids, dtype=np.int64)))
+
+
+def load_threat_grid(path):
+    """Load (grid, match_ids), checking the grid matches the configured resolution."""
+    with np.load(path, allow_pickle=False) as data:
+        grid, match_ids = data['grid'], data['match_ids']
+    if grid.shape != (GRID_ROWS, GRID_COLUMNS):
+        raise ValueError(f"'{path}' holds a {grid.shape} grid, expected {(GRID_ROWS, GRID_COLUMNS)}")
+    return grid, match_ids
+
+
+def threat_grid_for(arrays, path):
+    """
+    Saved grid if it was fitted on exactly these matches, otherwise a
+    freshly fitted (and saved) one. Returns (grid, refitted).
+    """
+    match_ids = np.unique(arrays['match_id'])
+    if os.path.exists(path):
+        try:
+            grid, fitted_on = load_threat_grid(path)
+        except (ValueError, KeyError):
+            fitted_on = None
+        if fitted_on is not None and np.array_equal(fitted_on, match_ids):
+            return grid, False
+    grid = fit_threat_grid(arrays)
+    save_threat_grid(grid, path, match_ids)
+    return grid, True
+
+
+def progression_metrics(arrays, grid):
+    """Per-action progression flags and threat gain for passes and carries."""
+    geometry = pass_geometry(arrays)
+    moves = np.isin(arrays['kind'], list(ACTION_TYPES)) & (geometry['direction'] >= 0)
+    completed = moves & geometry['completed']
+    values = grid.ravel()
+    gain = values[cell_of(arrays['end_x'], arrays['end_y'])] - values[cell_of(arrays['x'], arrays['y'])]
+    end_x = np.nan_to_num(arrays['end_x'])
+    end_y = np.nan_to_num(arrays['end_y'])
+    return {
+        'move': moves,
+        'completed': completed,
+        'progressive': completed & geometry['progressive'],
+        'final_third_entry': completed & geometry['final_third_entry'],
+        'box_entry': completed & ~in_box(arrays['x'], arrays['y']) & in_box(end_x, end_y),
+        'progress': np.where(completed, geometry['progress'], 0.0),
+        'xt_gain': np.where(completed, gain, 0.0),
+    }
+
+
+def progression_table(arrays, grid, by='team', metrics=None):
+    """Progression totals per team or player (by='player'), passes and carries combined."""
+    metrics = progression_metrics(arrays, grid) if metrics is None else metrics
+    mask = metrics['move'] & (arrays[by] != '')
+    keys, codes = np.unique(arrays[by][mask].astype(str), return_inverse=True)
+    size = len(keys)
+
+    def count(flags):
+        return np.bincount(codes[np.asarray(flags)[mask]], minlength=size)
+
+    def total(values):
+        return np.bincount(codes, weights=np.asarray(values, dtype=np.float64)[mask], minlength=size)
+
+    is_pass = arrays['kind'] == 'Pass'
+    table = pd.DataFrame({
+        'passes': count(is_pass),
+        'carries': count(~is_pass),
+        'completed': count(metrics['completed']),
+        'progressive': count(metrics['progressive']),
+        'progressive_carries': count(metrics['progressive'] & ~is_pass),
+        'final_third_entries': count(metrics['final_third_entry']),
+        'box_entries': count(metrics['box_entry']),
+        'progress': total(metrics['progress']),
+        'xt_gain': total(metrics['xt_gain']),
+        'xt_added': total(np.maximum(metrics['xt_gain'], 0)),
+    }, index=pd.Index(keys, name=by))
+    if by == 'player':
+        first = np.unique(codes, return_index=True)[1]
+        table.insert(0, 'team', arrays['team'][mask][first])
+    return table
+
+
+def load_arrays(paths):
+    """Action arrays for a batch of match files."""
+    batches = []
+    for path in paths:
+        events, _ = load_events(path, drop=('tactics', 'related_events', 'shot.freeze_frame'))
+        batches.append(action_arrays(events, match_id_from_path(path)))
+    return concat_passes(batches)
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    arrays = load_arrays(paths)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    grid_path = os.path.join(OUTPUT_DIR, THREAT_FILE)
+    grid, refitted = threat_grid_for(arrays, grid_path)
+    if refitted:
+        print(f"✓ Threat grid fitted on these matches and saved to '{grid_path}'")
+    else:
+        print(f"✓ Threat grid for these matches loaded from '{grid_path}'")
+    print(f"✓ {len(arrays['x']):,} actions from {len(paths)} match(es)")
+
+    metrics = progression_metrics(arrays, grid)
+    print("\n" + "="*80)
+    print("BALL PROGRESSION BY TEAM (passes + carries)")
+    print("="*80)
+    with pd.option_context('display.width', 160, 'display.max_columns', 20, 'display.precision', 2):
+        print(progression_table(arrays, grid, 'team', metrics))
+
+    players = progression_table(arrays, grid, 'player', metrics)
+    print("\nTop 10 players by expected threat added:")
+    for i, (player, row) in enumerate(players.sort_values('xt_added', ascending=False).head(10).iterrows(), 1):
+        print(f"  {i:2d}. {player:35s} ({row['team']:18s}) xT +{row['xt_added']:.2f}  "
+              f"{row['progressive']:3.0f} progressive, {row['box_entries']:2.0f} box entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
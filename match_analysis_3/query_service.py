@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Local Query Service
+===================================================
+
+Small asyncio HTTP service that parses and aggregates the match files once,
+keeps the per-match aggregates in memory and answers JSON queries from them.
+Computed responses are kept in an LRU cache, so dashboards get millisecond
+answers instead of re-running match_analysis.py for every question.
+
+Endpoints (all GET, all parameters optional):
+    /matches
+    /metrics?match=19736&team=Chelsea%20FCW
+    /players?match=19736,15946&team=Barcelona&limit=10
+    /timeline?match=19736&interval=5
+    /zones?match=19736&team=Arsenal%20WFC&type=Pass
+
+Usage:
+    python query_service.py
+    python query_service.py 8765 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import asyncio
+import json
+import sys
+import os
+from collections import Counter, defaultdict
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qsl
+
+import numpy as np
+
+from normalize import load_events
+from event_store import match_id_from_path
+from pass_engine import zone_of, ZONE_COLUMNS, ZONE_ROWS
+
+# Configuration
+DATA_FILES = ['19736.json']
+HOST = '127.0.0.1'
+PORT = 8765
+CACHE_SIZE = 1024
+DEFAULT_LIMIT = 15
+
+
+class MatchAggregate:
+    """Everything the service answers from, computed once per match."""
+
+    def __init__(self, match_id, events):
+        self.match_id = match_id
+        self.events = len(events)
+        self.teams = sorted({e['team']['name'] for e in events})
+        self.type_counts = defaultdict(Counter)
+        self.possession = Counter()
+        self.xg = Counter()
+        self.players = defaultdict(Counter)
+        self.player_teams = {}
+        self.minutes = defaultdict(Counter)
+        self.zones = defaultdict(lambda: np.zeros(ZONE_COLUMNS * ZONE_ROWS, dtype=np.int64))
+
+        located = defaultdict(list)
+        for event in events:
+            team = event['team']['name']
+            event_type = event['type']['name']
+            self.type_counts[team][event_type] += 1
+            self.possession[event['possession_team']['name']] += 1
+            self.minutes[team][event['minute']] += 1
+            player = event['player']['name']
+            if player:
+                self.players[team][player] += 1
+                self.player_teams[player] = team
+            if event_type == 'Shot':
+                self.xg[team] += event['shot'].get('statsbomb_xg', 0.0)
+            if event['location'] is not None:
+                located[(team, event_type)].append(event['location'][:2])
+
+        for key, locations in located.items():
+            xy = np.asarray(locations, dtype=np.float64)
+            self.zones[key] = np.bincount(zone_of(xy[:, 0], xy[:, 1]),
+                                          minlength=ZONE_COLUMNS * ZONE_ROWS)
+
+    def summary(self):
+        return {'match_id': self.match_id, 'events': self.events, 'teams': self.teams}
+
+
+class QueryService:
+    """Answers queries from in-memory aggregates with an LRU result cache."""
+
+    def __init__(self, paths, cache_size=CACHE_SIZE):
+        self.matches = {}
+        for path in paths:
+            events, _ = load_events(path)
+            match_id = match_id_from_path(path)
+            self.matches[match_id] = MatchAggregate(match_id, events)
+        self.handlers = {
+            '/matches': self.list_matches,
+            '/metrics': self.team_metrics,
+            '/players': self.top_players,
+            '/timeline': self.timeline,
+            '/zones': self.zone_counts,
+        }
+        self.query = lru_cache(maxsize=cache_size)(self._query)
+
+    def _select(self, params):
+        ids = params.get('match')
+        if not ids:
+            return list(self.matches.values())
+        try:
+            wanted = [int(i) for i in ids.split(',')]
+        except ValueError:
+            raise ValueError(f"invalid match id list '{ids}'")
+        missing = [i for i in wanted if i not in self.matches]
+        if missing:
+            raise KeyError(f"unknown match id(s): {', '.join(map(str, missing))}")
+        return [self.matches[i] for i in wanted]
+
+    def _teams(self, matches, params):
+        teams = sorted({t for m in matches for t in m.teams})
+        team = params.get('team')
+        return [team] if team else teams
+
+    def list_matches(self, params):
+        return [m.summary() for m in self._select(params)]
+
+    def team_metrics(self, params):
+        matches = self._select(params)
+        result = {}
+        for team in self._teams(matches, params):
+            types = sum((m.type_counts.get(team, Counter()) for m in matches), Counter())
+            # Share of the events in the matches this team actually played
+            played = [m for m in matches if team in m.teams]
+            possession = sum(m.possession[team] for m in played)
+            total = sum(sum(m.possession.values()) for m in played)
+            result[team] = {
+                'matches': len(played),
+                'events': sum(types.values()),
+                'passes': types['Pass'],
+                'shots': types['Shot'],
+                'xg': round(sum(m.xg[team] for m in matches), 3),
+                'possession_pct': round(100.0 * possession / total, 1) if total else 0.0,
+                'defensive_actions': types['Interception'] + types['Clearance'] + types['Duel'],
+                'event_types': dict(types.most_common()),
+            }
+        return result
+
+    def top_players(self, params):
+        matches = self._select(params)
+        limit = int(params.get('limit', DEFAULT_LIMIT))
+        totals = Counter()
+        teams = {}
+        for team in self._teams(matches, params):
+            for m in matches:
+                totals.update(m.players.get(team, {}))
+                teams.update({p: team for p in m.players.get(team, {})})
+        return [{'player': p, 'team': teams[p], 'events': c} for p, c in totals.most_common(limit)]
+
+    def timeline(self, params):
+        matches = self._select(params)
+        interval = max(int(params.get('interval', 5)), 1)
+        result = {}
+        for team in self._teams(matches, params):
+            buckets = Counter()
+            for m in matches:
+                for minute, count in m.minutes.get(team, {}).items():
+                    buckets[(minute // interval) * interval] += count
+            result[team] = {str(k): buckets[k] for k in sorted(buckets)}
+        return result
+
+    def zone_counts(self, params):
+        matches = self._select(params)
+        event_type = params.get('type')
+        result = {}
+        for team in self._teams(matches, params):
+            grid = np.zeros(ZONE_COLUMNS * ZONE_ROWS, dtype=np.int64)
+            for m in matches:
+                for (zone_team, zone_type), counts in m.zones.items():
+                    if zone_team == team and (event_type is None or zone_type == event_type):
+                        grid += counts
+            # rows across the pitch width, columns along its length
+            result[team] = grid.reshape(ZONE_COLUMNS, ZONE_ROWS).T.tolist()
+        return result
+
+    def _query(self, path, params):
+        """Compute an encoded response; params is a sorted tuple so results can be cached."""
+        handler = self.handlers.get(path)
+        if handler is None:
+            status, body = 404, {'error': f"unknown endpoint '{path}'", 'endpoints': sorted(self.handlers)}
+        else:
+            try:
+                status, body = 200, handler(dict(params))
+            except KeyError as e:
+                status, body = 404, {'error': str(e).strip("'\"")}
+            except ValueError as e:
+                status, body = 400, {'error': str(e)}
+        return status, json.dumps(body).encode('utf-8')
+
+    def respond(self, target):
+        """Status and JSON body for a request target such as '/metrics?team=X'."""
+        url = urlsplit(target)
+        params = tuple(sorted(parse_qsl(url.query)))
+        return self.query(url.path.rstrip('/') or '/', params)
+
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+async def handle_connection(service, reader, writer):
+    """Serve HTTP/1.1 GET requests on one (keep-alive) connection."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2:
+                break
+            method, target = parts[0], parts[1]
+            if method != 'GET':
+                status, body = 405, b'{"error": "only GET is supported"}'
+            else:
+                status, body = service.respond(target)
+
+            close = headers.get('connection', '').lower() == 'close'
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode('latin-1')
+                + body)
+            await writer.drain()
+            if close:
+                break
+    except (ConnectionResetError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service, host=HOST, port=PORT):
+    """Run the service until cancelled."""
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(service, r, w), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Main execution function."""
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    paths = sys.argv[2:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    service = QueryService(paths)
+    print(f"✓ {len(service.matches)} match(es) loaded and aggregated")
+    print(f"✓ Serving on http://{HOST}:{port}/ (Ctrl+C to stop)")
+    try:
+        asyncio.run(serve(service, HOST, port))
+    except KeyboardInterrupt:
+        print("\n✓ Service stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Possession Sequence Mining
+==========================================================
+
+Encodes every possession as an integer sequence of event type ids and counts
+event n-grams (length 2-5) per team. Counters are stored as sorted NumPy key
+and count arrays, so counting a match is a handful of array operations and
+counters from different matches can be merged into season-wide totals.
+
+Usage:
+    python sequence_mining.py
+    python sequence_mining.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+
+import numpy as np
+
+from normalize import load_events
+from fast_json import HEAVY_FIELDS
+
+# Configuration
+DATA_FILES = ['19736.json']
+MIN_N = 2
+MAX_N = 5
+TYPE_BITS = 6                      # StatsBomb event type ids are all < 64
+TYPE_MASK = (1 << TYPE_BITS) - 1
+LENGTH_SHIFT = TYPE_BITS * MAX_N   # n-gram length is packed above the types
+
+# Administrative events that are not part of the play inside a possession
+SKIP_TYPES = ('Starting XI', 'Half Start', 'Half End', 'Tactical Shift',
+              'Substitution', 'Injury Stoppage', 'Player On', 'Player Off')
+
+
+class NGramCounter:
+    """Compact counter of packed event-type n-gram keys."""
+
+    def __init__(self, keys=None, counts=None, type_names=None):
+        self.keys = np.zeros(0, dtype=np.int64) if keys is None else keys
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else counts
+        self.type_names = dict(type_names or {})
+
+    @classmethod
+    def from_keys(cls, keys, type_names):
+        """Build a counter from an unsorted array of packed keys."""
+        unique, counts = np.unique(keys, return_counts=True)
+        return cls(unique, counts.astype(np.int64), type_names)
+
+    def merge(self, other):
+        """Return a new counter holding the sum of both counters."""
+        keys = np.concatenate([self.keys, other.keys])
+        counts = np.concatenate([self.counts, other.counts])
+        unique, inverse = np.unique(keys, return_inverse=True)
+        totals = np.zeros(len(unique), dtype=np.int64)
+        np.add.at(totals, inverse, counts)
+        type_names = dict(self.type_names)
+        type_names.update(other.type_names)
+        return NGramCounter(unique, totals, type_names)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def total(self):
+        """Total number of n-gram occurrences."""
+        return int(self.counts.sum())
+
+    def most_common(self, k=10, n=None, last_type=None):
+        """Top-k n-grams as (names, count), optionally filtered by length or final event."""
+        mask = np.ones(len(self.keys), dtype=bool)
+        if n is not None:
+            mask &= (self.keys >> LENGTH_SHIFT) == n
+        if last_type is not None:
+            type_id = self._type_id(last_type)
+            if type_id is None:
+                return []
+            mask &= (self.keys & TYPE_MASK) == type_id
+        keys = self.keys[mask]
+        counts = self.counts[mask]
+        order = np.argsort(-counts, kind='stable')[:k]
+        return [(self.decode(keys[i]), int(counts[i])) for i in order]
+
+    def decode(self, key):
+        """Turn a packed key back into a tuple of event type names."""
+        key = int(key)
+        n = key >> LENGTH_SHIFT
+        ids = [(key >> (TYPE_BITS * (n - 1 - i))) & TYPE_MASK for i in range(n)]
+        return tuple(self.type_names.get(i, str(i)) for i in ids)
+
+    def _type_id(self, name):
+        for type_id, type_name in self.type_names.items():
+            if type_name == name:
+                return type_id
+        return None
+
+
+def encode_possessions(events, skip_types=SKIP_TYPES):
+    """Flatten normalized events into type id, possession and possession-team arrays."""
+    types = []
+    possessions = []
+    teams = []
+    type_names = {}
+    skip = set(skip_types)
+
+    for event in events:
+        event_type = event['type']
+        if event_type['name'] in skip:
+            continue
+        # Ids must fit the packed key; normalize does not bound them
+        type_id = event_type.get('id')
+        if not isinstance(type_id, int) or not 0 <= type_id <= TYPE_MASK:
+            continue
+        type_names[type_id] = event_type['name']
+        types.append(type_id)
+        possessions.append(event['possession'])
+        teams.append(event['possession_team']['name'])
+
+    return (np.array(types, dtype=np.int64),
+            np.array(possessions, dtype=np.int64),
+            np.array(teams, dtype=object),
+            type_names)
+
+
+def ngram_keys(types, possessions, n):
+    """Packed keys and start positions of every n-gram inside one possession."""
+    count = len(types) - n + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Events are in match order, so a window that starts and ends in the
+    # same possession never crosses into another one.
+    valid = possessions[:count] == possessions[n - 1:n - 1 + count]
+    keys = np.full(count, n << LENGTH_SHIFT, dtype=np.int64)
+    for offset in range(n):
+        shift = TYPE_BITS * (n - 1 - offset)
+        keys |= types[offset:offset + count] << shift
+
+    starts = np.nonzero(valid)[0]
+    return keys[starts], starts
+
+
+def count_ngrams(events, min_n=MIN_N, max_n=MAX_N, skip_types=SKIP_TYPES):
+    """Count possession n-grams per team for one match."""
+    if not MIN_N <= min_n <= max_n <= MAX_N:
+        raise ValueError(f"n-gram lengths must lie within {MIN_N}..{MAX_N}")
+
+    types, possessions, teams, type_names = encode_possessions(events, skip_types)
+    team_names, team_codes = np.unique(teams.astype(str), return_inverse=True)
+
+    per_team = {name: [] for name in team_names}
+    for n in range(min_n, max_n + 1):
+        keys, starts = ngram_keys(types, possessions, n)
+        codes = team_codes[starts]
+        for code, name in enumerate(team_names):
+            per_team[name].append(keys[codes == code])
+
+    return {name: NGramCounter.from_keys(np.concatenate(parts), type_names)
+            for name, parts in per_team.items()}
+
+
+def merge_counts(a, b):
+    """Merge two per-team counter dicts."""
+    merged = dict(a)
+    for team, counter in b.items():
+        merged[team] = merged[team].merge(counter) if team in merged else counter
+    return merged
+
+
+def count_files(paths, min_n=MIN_N, max_n=MAX_N, skip_types=SKIP_TYPES):
+    """Count n-grams over several match files and merge them per team."""
+    totals = {}
+    for path in paths:
+        events, _ = load_events(path, drop=HEAVY_FIELDS)
+        totals = merge_counts(totals, count_ngrams(events, min_n, max_n, skip_types))
+    return totals
+
+
+def print_report(counters, last_type='Shot', top=5):
+    """Print the most common sequences per team, and those ending in last_type."""
+    for team in sorted(counters):
+        counter = counters[team]
+        print(f"\n{team}: {counter.total():,} n-grams, {len(counter):,} distinct")
+        for n in range(MIN_N, MAX_N + 1):
+            for names, count in counter.most_common(1, n=n):
+                print(f"  Top {n}-gram: {' → '.join(names)} ({count})")
+        print(f"  Sequences leading to '{last_type}':")
+        for names, count in counter.most_common(top, n=3, last_type=last_type):
+            print(f"    • {' → '.join(names):60s} {count:4d}")
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    print("="*80)
+    print("POSSESSION SEQUENCE MINING")
+    print("="*80)
+    counters = count_files(paths)
+    print(f"✓ {len(paths)} match(es) processed")
+    print_report(counters)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Mergeable Summaries
+===================================================
+
+Aggregate types that merge associatively, so parallel workers can each
+summarise a shard of matches and a cheap reduce step produces season-wide
+results without reloading raw events:
+
+- FixedHistogram:  fixed-bin histogram (pass length distribution)
+- QuantileSketch:  relative-error quantiles (pass length, duration, xG)
+- DistinctCounter: HyperLogLog distinct count (players)
+- TopK:            Misra-Gries heavy hitters (most active players, event types)
+
+Usage:
+    python sketches.py
+    python sketches.py 19736.json ../Barca_vs_Alaves/15946.json
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import sys
+import os
+from functools import reduce
+from multiprocessing import Pool
+
+import numpy as np
+
+from normalize import load_events
+
+# Configuration
+DATA_FILES = ['19736.json']
+PASS_LENGTH_BINS = np.linspace(0, 120, 61)
+RELATIVE_ACCURACY = 0.01
+HLL_PRECISION = 12
+TOP_K = 50
+
+
+class FixedHistogram:
+    """Histogram over fixed bin edges; merging adds the counts."""
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.total = 0.0
+        self.n = 0
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.counts += np.histogram(values, bins=self.edges)[0]
+        self.total += float(values.sum())
+        self.n += len(values)
+        return self
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different bin edges")
+        merged = FixedHistogram(self.edges)
+        merged.counts = self.counts + other.counts
+        merged.total = self.total + other.total
+        merged.n = self.n + other.n
+        return merged
+
+    def mean(self):
+        return self.total / self.n if self.n else float('nan')
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch over non-negative values.
+
+    Values are mapped to logarithmic buckets so every quantile is within
+    RELATIVE_ACCURACY of the true value; merging adds bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.zeros = 0
+        self.n = 0
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if np.any(values < 0):
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        positive = values[values > 0]
+        self.zeros += len(values) - len(positive)
+        self.n += len(values)
+        keys = np.ceil(np.log(positive) / self.log_gamma).astype(np.int64)
+        self._add_buckets(keys, np.ones(len(keys), dtype=np.int64))
+        return self
+
+    def _add_buckets(self, keys, counts):
+        keys = np.concatenate([self.keys, keys])
+        counts = np.concatenate([self.counts, counts])
+        self.keys, inverse = np.unique(keys, return_inverse=True)
+        self.counts = np.zeros(len(self.keys), dtype=np.int64)
+        np.add.at(self.counts, inverse, counts)
+
+    def merge(self, other):
+        if self.relative_accuracy != other.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        merged = QuantileSketch(self.relative_accuracy)
+        merged.keys, merged.counts = self.keys, self.counts
+        merged._add_buckets(other.keys, other.counts)
+        merged.zeros = self.zeros + other.zeros
+        merged.n = self.n + other.n
+        return merged
+
+    def quantile(self, q):
+        """Approximate value at quantile(s) q in [0, 1]."""
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        rank = q * (self.n - 1)
+        cumulative = self.zeros + np.cumsum(self.counts)
+        position = np.searchsorted(cumulative, rank, side='right')
+        position = np.minimum(position, len(self.keys) - 1)
+        values = 2 * self.gamma ** self.keys / (self.gamma + 1) if len(self.keys) else np.zeros(1)
+        result = np.where(rank < self.zeros, 0.0, values[np.maximum(position, 0)])
+        return result if result.ndim else float(result)
+
+
+def _hash64(values):
+    """splitmix64 finalizer, applied element-wise to unsigned 64-bit ints."""
+    z = np.asarray(values).astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _bit_length(values):
+    """Exact bit length of each unsigned 64-bit value."""
+    values = values.copy()
+    length = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >= (np.uint64(1) << np.uint64(shift))
+        length[high] += shift
+        values[high] >>= np.uint64(shift)
+    return length + (values > 0)
+
+
+class DistinctCounter:
+    """HyperLogLog distinct count of integer ids; merging takes register maxima."""
+
+    def __init__(self, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, ids):
+        hashed = _hash64(ids)
+        if len(hashed) == 0:
+            return self
+        width = 64 - self.precision
+        buckets = (hashed >> np.uint64(width)).astype(np.int64)
+        rest = hashed & np.uint64((1 << width) - 1)
+        rank = (width - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, rank)
+        return self
+
+    def merge(self, other):
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge counters with different precision")
+        merged = DistinctCounter(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(2.0 ** -self.registers.astype(np.float64))
+        empty = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and empty:
+            return m * np.log(m / empty)
+        return raw
+
+
+class TopK:
+    """Misra-Gries heavy hitters; counts are lower bounds within n/(k+1)."""
+
+    def __init__(self, k=TOP_K):
+        self.k = k
+        self.counts = {}
+
+    def add(self, items):
+        items = np.asarray(items)
+        if len(items) == 0:
+            return self
+        names, counts = np.unique(items, return_counts=True)
+        batch = TopK(self.k)
+        batch.counts = {name.item(): int(c) for name, c in zip(names, counts)}
+        self.counts = self.merge(batch).counts
+        return self
+
+    def merge(self, other):
+        if self.k != other.k:
+            raise ValueError("Cannot merge heavy hitters with different k")
+        combined = dict(self.counts)
+        for item, count in other.counts.items():
+            combined[item] = combined.get(item, 0) + count
+        merged = TopK(self.k)
+        if len(combined) > self.k:
+            cutoff = sorted(combined.values(), reverse=True)[self.k]
+            combined = {item: c - cutoff for item, c in combined.items() if c > cutoff}
+        merged.counts = combined
+        return merged
+
+    def most_common(self, n=None):
+        ranked = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        return ranked[:n]
+
+
+class ShardSummary:
+    """All mergeable aggregates for a shard of matches."""
+
+    def __init__(self):
+        self.matches = 0
+        self.pass_length_hist = FixedHistogram(PASS_LENGTH_BINS)
+        self.pass_length = QuantileSketch()
+        self.duration = QuantileSketch()
+        self.xg = QuantileSketch()
+        self.players = DistinctCounter()
+        self.top_players = TopK()
+        self.event_types = TopK()
+
+    def merge(self, other):
+        merged = ShardSummary()
+        merged.matches = self.matches + other.matches
+        for name in ('pass_length_hist', 'pass_length', 'duration', 'xg',
+                     'players', 'top_players', 'event_types'):
+            setattr(merged, name, getattr(self, name).merge(getattr(other, name)))
+        return merged
+
+
+def summarise_events(events):
+    """Summarise one normalized match."""
+    summary = ShardSummary()
+    summary.matches = 1
+
+    types = np.array([e['type']['name'] for e in events], dtype=object)
+    pass_lengths = np.array([e['pass'].get('length', np.nan) for e in events if 'pass' in e],
+                            dtype=np.float64)
+    xg = np.array([e['shot'].get('statsbomb_xg', np.nan) for e in events if 'shot' in e],
+                  dtype=np.float64)
+    durations = np.array([e['duration'] for e in events], dtype=np.float64)
+    player_ids = np.array([e['player']['id'] for e in events if e['player']['id'] is not None],
+                          dtype=np.int64)
+    player_names = np.array([e['player']['name'] for e in events if e['player']['name']],
+                            dtype=object)
+
+    summary.pass_length_hist.add(pass_lengths)
+    summary.pass_length.add(pass_lengths)
+    summary.xg.add(xg)
+    summary.duration.add(durations)
+    summary.players.add(player_ids)
+    summary.top_players.add(player_names.astype(str))
+    summary.event_types.add(types.astype(str))
+    return summary
+
+
+def summarise_file(path):
+    """Summarise one match file (usable as a worker function)."""
+    events, _ = load_events(path)
+    return summarise_events(events)
+
+
+def summarise_files(paths, processes=None):
+    """Summarise files in parallel and reduce to one season-wide summary."""
+    if processes == 1 or len(paths) < 2:
+        shards = [summarise_file(path) for path in paths]
+    else:
+        with Pool(processes) as pool:
+            shards = pool.map(summarise_file, paths)
+    return reduce(ShardSummary.merge, shards, ShardSummary())
+
+
+def print_summary(summary):
+    """Print the season-wide summary."""
+    print(f"\nMatches: {summary.matches}")
+    print(f"Distinct players (approx.): {summary.players.estimate():.0f}")
+    print(f"Mean pass length: {summary.pass_length_hist.mean():.1f}m")
+    for label, sketch in (('Pass length', summary.pass_length),
+                          ('Duration', summary.duration),
+                          ('xG', summary.xg)):
+        p10, p50, p90 = sketch.quantile([0.1, 0.5, 0.9])
+        print(f"{label:12s} p10={p10:.3f}  p50={p50:.3f}  p90={p90:.3f}")
+    print("\nTop players:")
+    for name, count in summary.top_players.most_common(10):
+        print(f"  • {name:35s} ≥{count:5d}")
+    print("\nTop event types:")
+    for name, count in summary.event_types.most_common(5):
+        print(f"  • {name:25s} ≥{count:5d}")
+
+
+def main():
+    """Main execution function."""
+    paths = sys.argv[1:] or DATA_FILES
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        print(f"❌ Error: Dataset file(s) not found: {', '.join(missing)}")
+        return 1
+
+    print_summary(summarise_files(paths))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Football Match Event Analysis - Synthetic Match Generator
+=========================================================
+
+Learns event-type transitions, team/possession switches, locations, pass and
+carry displacements, durations and nested detail objects from the bundled
+StatsBomb files, then emits any number of realistic matches in the same
+event-array format (or as JSON lines). Generation is deterministic: match k
+of seed s is always the same, whatever the batch size, so load and scaling
+tests are reproducible without network access.
+
+Usage:
+    python synthetic_matches.py                      # 10 matches to synthetic/
+    python synthetic_matches.py 10000 synthetic 42   # count, output dir, seed
+    python synthetic_matches.py 100 synthetic 42 --jsonl
+
+Author: Data Analysis Project
+Date: February 2026
+"""
+
+import json
+import math
+import sys
+import os
+import uuid
+from bisect import bisect_right
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from normalize import load_events
+from sequence_mining import SKIP_TYPES
+
+# Configuration
+SOURCE_FILES = ['19736.json', '../Barca_vs_Alaves/15946.json',
+                '../match_analysis_2/16056.json', '../match_analysis_4/16157.json']
+OUTPUT_DIR = 'synthetic'
+FIRST_MATCH_ID = 9000000
+LEAGUE_SIZE = 20
+SQUAD_SIZE = 11
+PITCH = (120.0, 80.0)
+UNIFORMS_PER_EVENT = 12
+
+# Detail types whose end_location is re-derived from a sampled displacement
+ENDPOINT_DETAILS = {'Pass': 'pass', 'Carry': 'carry'}
+# Detail keys that reference other events or real players and are dropped
+DROPPED_DETAIL_KEYS = ('freeze_frame', 'key_pass_id', 'assisted_shot_id',
+                       'recipient', 'replacement', 'length', 'angle')
+DETAIL_FIELDS = ('pass', 'carry', 'shot', 'duel', 'interception', 'dribble',
+                 'goalkeeper', 'clearance', 'ball_receipt', 'ball_recovery',
+                 'foul_committed', 'foul_won', 'block', 'miscontrol', 'bad_behaviour')
+POSITIONS = ('Goalkeeper', 'Right Back', 'Right Center Back', 'Left Center Back',
+             'Left Back', 'Right Center Midfield', 'Center Defensive Midfield',
+             'Left Center Midfield', 'Right Wing', 'Center Forward', 'Left Wing')
+
+
+class SyntheticModel:
+    """Empirical distributions learned from real matches."""
+
+    def __init__(self, paths):
+        transitions = defaultdict(Counter)
+        self.type_ids = {}
+        self.locations = defaultdict(list)
+        self.displacements = defaultdict(list)
+        self.durations = defaultdict(list)
+        self.templates = defaultdict(list)
+        self.with_player = Counter()
+        self.with_location = Counter()
+        self.under_pressure = Counter()
+        self.type_counts = Counter()
+        self.play_patterns = Counter()
+        self.period_events = []
+        self.period_lengths = []
+        same_team_changes = Counter()
+
+        for path in paths:
+            events, _ = load_events(path)
+            self._learn_periods(events)
+            previous = None
+            for event in events:
+                name = event['type']['name']
+                if name in SKIP_TYPES:
+                    continue
+                self.type_ids[name] = event['type']['id']
+                self._learn_fields(name, event)
+                own = event['team']['name'] == event['possession_team']['name']
+                state = (name, own)
+                if previous is not None and previous['period'] == event['period']:
+                    changed = event['possession'] != previous['possession']
+                    transitions[self._state(previous)][state + (changed,)] += 1
+                    if changed:
+                        same = event['possession_team']['name'] == previous['possession_team']['name']
+                        same_team_changes[same] += 1
+                        pattern = event['play_pattern']
+                        self.play_patterns[(pattern['id'], pattern['name'])] += 1
+                previous = event
+
+        self.states = sorted({s for s in transitions} |
+                             {t[:2] for row in transitions.values() for t in row})
+        self.state_index = {s: i for i, s in enumerate(self.states)}
+        self.cumulative = []
+        self.targets = []
+        for state in self.states:
+            row = transitions.get(state) or Counter({state + (False,): 1})
+            targets = list(row)
+            counts = np.array([row[t] for t in targets], dtype=np.float64)
+            self.targets.append([(self.state_index[t[:2]], t[2]) for t in targets])
+            self.cumulative.append(list(np.cumsum(counts) / counts.sum()))
+        self.keep_possession_team = same_team_changes[True] / max(sum(same_team_changes.values()), 1)
+        self.field_probabilities = {
+            name: (self.probability(self.with_player, name),
+                   self.probability(self.with_location, name),
+                   self.probability(self.under_pressure, name))
+            for name in self.type_counts}
+        patterns = sorted(self.play_patterns)
+        self.patterns = [{'id': i, 'name': name} for i, name in patterns]
+        self.pattern_cumulative = list(np.cumsum([self.play_patterns[p] for p in patterns])
+                                       / max(sum(self.play_patterns.values()), 1))
+
+    def _state(self, event):
+        return (event['type']['name'], event['team']['name'] == event['possession_team']['name'])
+
+    def _learn_periods(self, events):
+        per_period = Counter(e['period'] for e in events if e['type']['name'] not in SKIP_TYPES)
+        for period, count in per_period.items():
+            if period <= 2:
+                self.period_events.append(count)
+        for event in events:
+            if event['type']['name'] == 'Half End' and event['period'] <= 2:
+                hours, minutes, seconds = event['timestamp'].split(':')
+                self.period_lengths.append(int(hours) * 3600 + int(minutes) * 60 + float(seconds))
+
+    def _learn_fields(self, name, event):
+        self.type_counts[name] += 1
+        self.with_player[name] += event['player']['name'] is not None
+        self.with_location[name] += event['location'] is not None
+        self.under_pressure[name] += bool(event['under_pressure'])
+        self.durations[name].append(event['duration'])
+        if event['location'] is not None:
+            self.locations[name].append(event['location'][:2])
+        for field in DETAIL_FIELDS:
+            if field in event and event[field]:
+                detail = {k: v for k, v in event[field].items() if k not in DROPPED_DETAIL_KEYS}
+                self.templates[name].append((field, detail))
+                end = event[field].get('end_location')
+                if name in ENDPOINT_DETAILS and end and event['location'] is not None:
+                    self.displacements[name].append((end[0] - event['location'][0],
+                                                     end[1] - event['location'][1]))
+                break
+
+    def probability(self, counter, name):
+        return counter[name] / max(self.type_counts[name], 1)
+
+
+def _league():
+    """Synthetic league: team names and squads."""
+    teams = [f"Synthetic FC {i + 1:02d}" for i in range(LEAGUE_SIZE)]
+    squads = {team: [{'id': 900000 + t * 100 + p, 'name': f"{team} Player {p + 1:02d}"}
+                     for p in range(SQUAD_SIZE)]
+              for t, team in enumerate(teams)}
+    return teams, squads
+
+
+def _clock(seconds):
+    minutes, secs = divmod(seconds, 60.0)
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+
+
+class MatchGenerator:
+    """Generates matches from a SyntheticModel, deterministically per seed."""
+
+    def __init__(self, model, seed=0):
+        self.model = model
+        self.seed = seed
+        self.teams, self.squads = _league()
+        self.team_ids = {team: 9000 + i for i, team in enumerate(self.teams)}
+
+    def match(self, number):
+        """Generate match `number` (0-based) as a list of StatsBomb-style events."""
+        rng = np.random.default_rng([self.seed, number])
+        model = self.model
+        home, away = rng.choice(len(self.teams), size=2, replace=False)
+        teams = [self.teams[home], self.teams[away]]
+        lengths = [float(rng.choice(model.period_lengths)) for _ in range(2)]
+        counts = [int(rng.choice(model.period_events)) for _ in range(2)]
+        # Starting XI, Half Start and Half End per team on top of the sampled events
+        id_bytes = rng.bytes(16 * (sum(counts) + len(teams) * 5))
+        events = []
+
+        def base(period, seconds, type_name, team, possession, possession_team, pattern):
+            offset = 16 * len(events)
+            return {
+                'id': str(uuid.UUID(bytes=id_bytes[offset:offset + 16], version=4)),
+                'index': len(events) + 1,
+                'period': period,
+                'timestamp': _clock(seconds),
+                'minute': int(seconds // 60) + (45 * (period - 1)),
+                'second': int(seconds % 60),
+                'type': {'id': model.type_ids.get(type_name, 0), 'name': type_name},
+                'possession': possession,
+                'possession_team': {'id': self.team_ids[possession_team], 'name': possession_team},
+                'play_pattern': pattern,
+                'team': {'id': self.team_ids[team], 'name': team},
+                'duration': 0.0,
+            }
+
+        regular = {'id': 1, 'name': 'Regular Play'}
+        for team in teams:
+            event = base(1, 0.0, 'Starting XI', team, 1, teams[0], regular)
+            event['type']['id'] = 35
+            event['tactics'] = {'formation': 4231, 'lineup': [
+                {'player': player, 'position': {'id': i + 1, 'name': POSITIONS[i]},
+                 'jersey_number': i + 1}
+                for i, player in enumerate(self.squads[team])]}
+            events.append(event)
+
+        possession = 1
+        possession_team = 0
+        pattern = regular
+        for period, length, count in zip((1, 2), lengths, counts):
+            times = np.sort(rng.uniform(0.0, length, size=count)).tolist()
+            uniforms = rng.random(size=(count, UNIFORMS_PER_EVENT)).tolist()
+            for team in teams:
+                event = base(period, 0.0, 'Half Start', team, possession, teams[possession_team], pattern)
+                event['type']['id'] = 18
+                events.append(event)
+
+            state = model.state_index.get(('Pass', True), 0)
+            for seconds, u in zip(times, uniforms):
+                targets = model.targets[state]
+                state, changed = targets[bisect_right(model.cumulative[state], u[0])]
+                if changed:
+                    possession += 1
+                    if u[1] >= model.keep_possession_team:
+                        possession_team = 1 - possession_team
+                    index = bisect_right(model.pattern_cumulative, u[2])
+                    pattern = model.patterns[min(index, len(model.patterns) - 1)]
+                type_name, own = model.states[state]
+                team = teams[possession_team if own else 1 - possession_team]
+                event = base(period, seconds, type_name, team, possession,
+                             teams[possession_team], pattern)
+                self._fill(event, type_name, team, u)
+                events.append(event)
+
+            for team in teams:
+                event = base(period, length, 'Half End', team, possession, teams[possession_team], pattern)
+                event['type']['id'] = 34
+                events.append(event)
+
+        return events
+
+    def _fill(self, event, type_name, team, u):
+        """Fill player, location and detail fields from pre-drawn uniforms u[3:]."""
+        model = self.model
+        squad = self.squads[team]
+        p_player, p_location, p_pressure = model.field_probabilities.get(type_name, (0, 0, 0))
+        if u[3] < p_player:
+            slot = int(u[4] * len(squad))
+            event['player'] = squad[slot]
+            event['position'] = {'id': slot + 1, 'name': POSITIONS[slot]}
+        if u[5] < p_pressure:
+            event['under_pressure'] = True
+        durations = model.durations.get(type_name)
+        if durations:
+            event['duration'] = durations[int(u[6] * len(durations))]
+        locations = model.locations.get(type_name)
+        if locations and u[7] < p_location:
+            event['location'] = list(locations[int(u[8] * len(locations))])
+
+        templates = model.templates.get(type_name)
+        if not templates:
+            return
+        field, template = templates[int(u[9] * len(templates))]
+        displacements = model.displacements.get(type_name)
+        if type_name in ENDPOINT_DETAILS and 'location' in event and displacements:
+            detail = dict(template)
+            dx, dy = displacements[int(u[10] * len(displacements))]
+            x0, y0 = event['location'][:2]
+            x = round(min(max(x0 + dx, 0.0), PITCH[0]), 1)
+            y = round(min(max(y0 + dy, 0.0), PITCH[1]), 1)
+            detail['end_location'] = [x, y]
+            if field == 'pass':
+                detail['length'] = math.hypot(x - x0, y - y0)
+                detail['angle'] = math.atan2(y - y0, x - x0)
+                if 'outcome' not in detail:
+                    detail['recipient'] = squad[int(u[11] * len(squad))]
+            event[field] = detail
+        else:
+            # Nested objects are shared between events; treat output as read-only
+            event[field] = template
+
+    def matches(self, count, start=0):
+        """Yield (match_id, events) for matches start .. start + count - 1."""
+        for number in range(start, start + count):
+            yield FIRST_MATCH_ID + number, self.match(number)
+
+
+def write_matches(generator, count, output_dir=OUTPUT_DIR, jsonl=False, start=0):
+    """Write generated matches as <match_id>.json arrays or .jsonl files."""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for match_id, events in generator.matches(count, start):
+        path = os.path.join(output_dir, f"{match_id}.{'jsonl' if jsonl else 'json'}")
+        with open(path, 'w') as f:
+            if jsonl:
+                for event in events:
+                    f.write(json.dumps(event) + '\n')
+            else:
+                f.write(json.dumps(events))
+        paths.append(path)
+    return paths
+
+
+def main():
+    """Main execution function."""
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    count = int(args[0]) if len(args) > 0 else 10
+    output_dir = args[1] if len(args) > 1 else OUTPUT_DIR
+    seed = int(args[2]) if len(args) > 2 else 0
+    jsonl = '--jsonl' in sys.argv
+
+    sources = [p for p in SOURCE_FILES if os.path.exists(p)]
+    if not sources:
+        print("❌ Error: No source match files found to learn from!")
+        return 1
+
+    model = SyntheticModel(sources)
+    print(f"✓ Model learned from {len(sources)} match(es): {len(model.states)} states")
+    paths = write_matches(MatchGenerator(model, seed), count, output_dir, jsonl)
+    print(f"✓ {len(paths):,} synthetic matches written to '{output_dir}/'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())